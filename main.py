@@ -6,6 +6,7 @@ This script demonstrates how to use the pipeline with sample data.
 """
 
 import argparse
+import importlib.util
 from pathlib import Path
 
 from src.pipeline import DataCleaningPipeline
@@ -15,6 +16,11 @@ from src.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Sample data only feeds this pipeline, so prefer Parquet when it can be written
+SAMPLE_FILE = SAMPLE_DATA_DIR / (
+    "sample_messy_data.parquet" if importlib.util.find_spec("pyarrow") else "sample_messy_data.csv"
+)
+
 
 def main():
     """Run the data cleaning pipeline."""
@@ -24,7 +30,7 @@ def main():
     parser.add_argument(
         "--input",
         type=str,
-        help="Path to input CSV file (default: use sample data)"
+        help="Path to input CSV or Parquet file (default: use sample data)"
     )
     parser.add_argument(
         "--output-dir",
@@ -60,17 +66,23 @@ def main():
     )
     parser.add_argument(
         "--export-format",
-        choices=["csv", "json"],
+        choices=["csv", "json", "parquet"],
         default="csv",
         help="Export format (default: csv)"
     )
+    parser.add_argument(
+        "--backend",
+        choices=["pandas", "dask", "chunked", "arrow"],
+        default="pandas",
+        help="Execution backend; dask and chunked process inputs larger than memory (default: pandas)"
+    )
     
     args = parser.parse_args()
     
     # Generate sample data if requested
     if args.generate_sample:
         logger.info("Generating sample messy data...")
-        sample_file = SAMPLE_DATA_DIR / "sample_messy_data.csv"
+        sample_file = SAMPLE_FILE
         generate_sample_data(
             num_rows=args.rows,
             output_path=sample_file,
@@ -86,7 +98,7 @@ def main():
         input_path = Path(args.input)
     else:
         # Use sample data
-        sample_file = SAMPLE_DATA_DIR / "sample_messy_data.csv"
+        sample_file = SAMPLE_FILE
         if not sample_file.exists():
             logger.info("Sample data not found, generating it...")
             generate_sample_data(
@@ -115,7 +127,8 @@ def main():
     pipeline = DataCleaningPipeline(
         input_path=input_path,
         output_dir=output_dir,
-        output_filename=output_filename
+        output_filename=output_filename,
+        backend=args.backend
     )
     
     try:
@@ -2,6 +2,12 @@
 
 __version__ = "1.0.0"
 
+import pandas as pd
+
+# Cleaning steps return new frames that share unchanged column data with
+# their input; copy-on-write keeps those shared columns isolated.
+pd.set_option("mode.copy_on_write", True)
+
 from .pipeline import DataCleaningPipeline
 from .data_generator import generate_sample_data
 from .exceptions import (
@@ -0,0 +1,247 @@
+"""Arrow execution backend that keeps the data in a pyarrow Table throughout."""
+
+from pathlib import Path
+from typing import List, Optional
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+from .cleaning import standardize_column_names, parse_dates, _detect_date_format
+from .config import MISSING_VALUE_THRESHOLD, DATE_FORMATS
+from .ingestion import ingest_csv
+from .logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def _require_arrow() -> None:
+    """Raise a helpful error if pyarrow is not installed."""
+    if pa is None:
+        raise ImportError("backend='arrow' requires the pyarrow package")
+
+
+def _is_numeric(arrow_type: "pa.DataType") -> bool:
+    """Whether a column is imputed with its median rather than its mode."""
+    return pa.types.is_integer(arrow_type) or pa.types.is_floating(arrow_type)
+
+
+def ingest_arrow(file_path: Path) -> "pa.Table":
+    """
+    Read a CSV or Parquet file into an Arrow Table.
+    
+    Args:
+        file_path: Path to the data file
+    
+    Returns:
+        Arrow Table with the file contents
+    """
+    _require_arrow()
+    if file_path.suffix == ".parquet":
+        logger.info("Reading %s with pyarrow", file_path)
+        return pq.read_table(file_path)
+    return ingest_csv(file_path, backend="arrow")
+
+
+def clean_arrow(
+    table: "pa.Table",
+    remove_duplicates_flag: bool = True,
+    missing_value_strategy: str = "auto",
+    standardize_columns: bool = True,
+    date_columns: Optional[List[str]] = None,
+    remove_outliers_flag: bool = False,
+    outlier_columns: Optional[List[str]] = None,
+    threshold: float = MISSING_VALUE_THRESHOLD,
+    iqr_multiplier: float = 1.5
+) -> "pa.Table":
+    """
+    Apply the pipeline's cleaning steps with Arrow compute kernels.
+    
+    Args:
+        table: Input Arrow Table
+        remove_duplicates_flag: Whether to remove duplicate rows
+        missing_value_strategy: 'auto', 'drop_rows' or 'drop_columns'
+        standardize_columns: Whether to standardize column names
+        date_columns: List of columns to parse as dates
+        remove_outliers_flag: Whether to remove outliers (IQR method)
+        outlier_columns: Specific columns to check for outliers
+        threshold: Fraction of missing values above which 'auto' drops a column
+        iqr_multiplier: IQR multiplier for outlier bounds
+    
+    Returns:
+        Cleaned Arrow Table
+    """
+    _require_arrow()
+    
+    if standardize_columns:
+        table = table.rename_columns(
+            standardize_column_names(pd.DataFrame(columns=table.column_names)).columns.tolist()
+        )
+    
+    # Categorical (dictionary) columns are cleaned as plain values, then
+    # encoded again at the end
+    dictionary_columns = [field.name for field in table.schema if pa.types.is_dictionary(field.type)]
+    for name in dictionary_columns:
+        i = table.column_names.index(name)
+        table = table.set_column(i, name, table.column(i).cast(table.schema.field(i).type.value_type))
+    
+    if remove_duplicates_flag:
+        # Grouping on every column with no aggregates keeps one row per
+        # distinct row; single-threaded grouping preserves first-seen order
+        initial_rows = table.num_rows
+        table = table.group_by(table.column_names, use_threads=False).aggregate([])
+        logger.info("Removed %s duplicate rows", initial_rows - table.num_rows)
+    
+    if missing_value_strategy == "auto":
+        table = _impute_arrow(table, threshold)
+    elif missing_value_strategy == "drop_rows":
+        table = table.drop_null()
+    elif missing_value_strategy == "drop_columns":
+        table = table.drop_columns([name for name in table.column_names if table.column(name).null_count])
+    else:
+        raise ValueError(f"Missing value strategy '{missing_value_strategy}' is not supported by the Arrow backend")
+    
+    for i, field in enumerate(table.schema):
+        if pa.types.is_string(field.type) or pa.types.is_large_string(field.type):
+            table = table.set_column(i, field.name, pc.utf8_trim_whitespace(table.column(i)))
+    
+    for col in date_columns or []:
+        if col not in table.column_names:
+            logger.warning("Date column '%s' not found in table", col)
+            continue
+        table = table.set_column(table.column_names.index(col), col, _parse_dates_arrow(table.column(col), col))
+    
+    if remove_outliers_flag:
+        table = _filter_outliers_arrow(table, outlier_columns, iqr_multiplier)
+    
+    for name in dictionary_columns:
+        if name in table.column_names:
+            i = table.column_names.index(name)
+            table = table.set_column(i, name, pc.dictionary_encode(table.column(i)))
+    
+    return table
+
+
+def _impute_arrow(table: "pa.Table", threshold: float) -> "pa.Table":
+    """Drop mostly-missing columns, then fill numeric nulls with the median and others with the mode."""
+    nrows = table.num_rows
+    cols_to_drop = [
+        name for name in table.column_names
+        if nrows and table.column(name).null_count / nrows > threshold
+    ]
+    if cols_to_drop:
+        logger.info("Dropping columns with >%s%% missing: %s", threshold * 100, cols_to_drop)
+        table = table.drop_columns(cols_to_drop)
+    
+    for i, field in enumerate(table.schema):
+        column = table.column(i)
+        if not column.null_count:
+            continue
+        
+        if _is_numeric(column.type):
+            fill = pc.quantile(column, q=0.5)[0].as_py()
+            if fill is not None and pa.types.is_integer(column.type):
+                # Integer columns cannot hold a fractional median
+                fill = round(fill)
+        else:
+            fill = _mode_arrow(column)
+        
+        if fill is not None:
+            column = pc.fill_null(column, pa.scalar(fill, type=column.type))
+            logger.debug("Filled %s with: %s", field.name, fill)
+        table = table.set_column(i, field.name, column)
+    
+    return table
+
+
+def _mode_arrow(column: "pa.ChunkedArray"):
+    """Return the most frequent non-null value (the smallest on ties, as pandas does), or 'Unknown'."""
+    counts = pc.value_counts(pc.drop_null(column))
+    if not len(counts):
+        return "Unknown"
+    frequencies = counts.field("counts")
+    top = pc.filter(counts.field("values"), pc.equal(frequencies, pc.max(frequencies)))
+    return pc.min(top).as_py()
+
+
+def _parse_dates_arrow(column: "pa.ChunkedArray", name: str) -> "pa.ChunkedArray":
+    """Parse a date column with the detected format, falling back to pandas for mixed formats."""
+    if pa.types.is_timestamp(column.type):
+        return column
+    
+    sample = pd.Series(column.slice(0, 10_000).to_pylist(), dtype=object)
+    fmt = _detect_date_format(sample, DATE_FORMATS)
+    if fmt is not None:
+        logger.info("Parsed date column '%s' with format: %s", name, fmt)
+        return pc.strptime(column.cast(pa.string()), format=fmt, unit="ns", error_is_null=True)
+    
+    # No single format fits; this column goes through pandas' per-value inference
+    parsed = parse_dates(pd.DataFrame({name: column.to_pandas()}), [name])[name]
+    return pa.chunked_array([pa.Array.from_pandas(parsed)])
+
+
+def _filter_outliers_arrow(
+    table: "pa.Table",
+    columns: Optional[List[str]],
+    iqr_multiplier: float
+) -> "pa.Table":
+    """Remove rows whose numeric columns fall outside the IQR bounds."""
+    if columns is None:
+        columns = [field.name for field in table.schema if _is_numeric(field.type)]
+    columns = [col for col in columns if col in table.column_names]
+    
+    mask = None
+    for col in columns:
+        column = table.column(col)
+        q1, q3 = pc.quantile(column, q=[0.25, 0.75]).to_pylist()
+        if q1 is None:
+            continue
+        iqr = q3 - q1
+        in_bounds = pc.and_(
+            pc.greater_equal(column, q1 - iqr_multiplier * iqr),
+            pc.less_equal(column, q3 + iqr_multiplier * iqr)
+        )
+        mask = in_bounds if mask is None else pc.and_(mask, in_bounds)
+    
+    if mask is None:
+        return table
+    
+    # Null comparisons drop the row, as NaN does on the pandas path
+    filtered = table.filter(mask)
+    logger.info("Removed %s outlier rows", table.num_rows - filtered.num_rows)
+    return filtered
+
+
+def export_arrow(table: "pa.Table", output_path: Path, export_format: str = "parquet") -> Path:
+    """
+    Write an Arrow Table to disk.
+    
+    Args:
+        table: Table to export
+        output_path: Output file path; the suffix is replaced to match the format
+        export_format: 'parquet', 'csv' or 'json'
+    
+    Returns:
+        Path of the file written
+    """
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    
+    if export_format == "csv":
+        output_path = output_path.with_suffix(".csv")
+        pacsv.write_csv(table, output_path)
+    elif export_format == "json":
+        # Arrow has no JSON writer; this is the only pandas conversion
+        output_path = output_path.with_suffix(".json")
+        table.to_pandas().to_json(output_path, orient="records")
+    else:
+        output_path = output_path.with_suffix(".parquet")
+        pq.write_table(table, output_path, compression="zstd")
+    
+    logger.info("Exported %s rows to %s", table.num_rows, output_path)
+    return output_path
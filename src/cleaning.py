@@ -1,16 +1,48 @@
-"""Data cleaning module with functions to handle messy data."""
+"""Data cleaning module with functions to handle messy data.
 
+Cleaning functions never modify their input. They return new frames that,
+under copy-on-write, share the data of any column they leave untouched.
+"""
+
+import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Union
 import pandas as pd
 import numpy as np
 from datetime import datetime
 
-from .config import MISSING_VALUE_THRESHOLD, DATE_FORMATS
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+from .config import MISSING_VALUE_THRESHOLD, DATE_FORMATS, DATE_SAMPLE_SIZE
 from .exceptions import DataCleaningError
 from .logger import setup_logger
 
 logger = setup_logger(__name__)
 
+_NON_WORD = re.compile(r'[^\w\s]')
+_WHITESPACE = re.compile(r'\s+')
+# Every character str.strip() removes (none lie above U+3000)
+_WHITESPACE_CHARS = tuple(c for c in map(chr, range(0x3001)) if c.isspace())
+_WHITESPACE_SAMPLE_SIZE = 1024
+
+
+def _duplicate_prefix_columns(df: pd.DataFrame, max_columns: int = 3) -> List[str]:
+    """
+    Choose cheap-to-hash columns used to prefilter duplicate candidates.
+    
+    Returns an empty list when the frame is too narrow for a prefilter to help.
+    """
+    if len(df.columns) <= max_columns:
+        return []
+    
+    cheap = df.select_dtypes(include=[np.number, 'category', 'bool']).columns.tolist()
+    others = [col for col in df.columns if col not in cheap]
+    return (cheap + others)[:max_columns]
+
 
 def remove_duplicates(
     df: pd.DataFrame,
@@ -29,11 +61,21 @@ def remove_duplicates(
         DataFrame with duplicates removed
     """
     initial_rows = len(df)
-    df_cleaned = df.drop_duplicates(subset=subset, keep=keep)
+    prefix = _duplicate_prefix_columns(df) if subset is None else []
+    
+    if prefix:
+        # Rows can only be duplicates if their prefix columns are, so hash the
+        # full rows of those candidates only
+        candidates = df.duplicated(subset=prefix, keep=False).to_numpy()
+        is_duplicate = np.zeros(initial_rows, dtype=bool)
+        is_duplicate[candidates] = df[candidates].duplicated(keep=keep).to_numpy()
+        df_cleaned = df[~is_duplicate]
+    else:
+        df_cleaned = df.drop_duplicates(subset=subset, keep=keep)
     duplicates_removed = initial_rows - len(df_cleaned)
     
     if duplicates_removed > 0:
-        logger.info(f"Removed {duplicates_removed} duplicate rows ({duplicates_removed/initial_rows*100:.2f}%)")
+        logger.info("Removed %s duplicate rows (%.2f%%)", duplicates_removed, duplicates_removed/initial_rows*100)
     else:
         logger.info("No duplicate rows found")
     
@@ -44,7 +86,8 @@ def handle_missing_values(
     df: pd.DataFrame,
     strategy: str = "auto",
     threshold: float = MISSING_VALUE_THRESHOLD,
-    fill_value: Optional[Union[str, int, float]] = None
+    fill_value: Optional[Union[str, int, float]] = None,
+    clean_text: bool = False
 ) -> pd.DataFrame:
     """
     Handle missing values in the dataframe.
@@ -58,61 +101,112 @@ def handle_missing_values(
             - 'fill': Fill with specified value or strategy
         threshold: Threshold for dropping columns (fraction of missing values)
         fill_value: Value to use for filling (if strategy='fill')
+        clean_text: Also strip whitespace from text columns, as
+            clean_text_columns does. With 'auto', each text column is filled
+            and stripped together instead of in two passes over the frame
         
     Returns:
         DataFrame with missing values handled
     """
-    df_cleaned = df.copy()
-    initial_missing = df_cleaned.isnull().sum().sum()
+    # Shallow copy: under copy-on-write, column data is only duplicated
+    # for the columns this function actually replaces
+    df_cleaned = df.copy(deep=False)
+    # Count nulls once; every branch below works from these per-column counts
+    per_col_null = df_cleaned.isnull().sum()
+    initial_missing = int(per_col_null.sum())
+    final_missing = initial_missing
     
-    logger.info(f"Initial missing values: {initial_missing}")
+    logger.info("Initial missing values: %s", initial_missing)
     
     if strategy == "auto":
         # Drop columns with too many missing values
-        missing_pct = df_cleaned.isnull().sum() / len(df_cleaned)
+        missing_pct = per_col_null / len(df_cleaned)
         cols_to_drop = missing_pct[missing_pct > threshold].index.tolist()
         
         if cols_to_drop:
-            logger.info(f"Dropping columns with >{threshold*100}% missing: {cols_to_drop}")
+            logger.info("Dropping columns with >%s%% missing: %s", threshold*100, cols_to_drop)
             df_cleaned = df_cleaned.drop(columns=cols_to_drop)
         
         # Impute remaining missing values
-        for col in df_cleaned.columns:
-            if df_cleaned[col].isnull().any():
-                if df_cleaned[col].dtype in ['int64', 'float64']:
-                    # Fill numeric with median
-                    fill_val = df_cleaned[col].median()
-                    df_cleaned[col] = df_cleaned[col].fillna(fill_val)
-                    logger.debug(f"Filled {col} with median: {fill_val}")
-                else:
-                    # Fill categorical with mode or 'Unknown'
-                    if df_cleaned[col].mode().empty:
-                        fill_val = 'Unknown'
-                    else:
-                        fill_val = df_cleaned[col].mode()[0]
-                    df_cleaned[col] = df_cleaned[col].fillna(fill_val)
-                    logger.debug(f"Filled {col} with: {fill_val}")
+        missing_cols = [col for col in df_cleaned.columns if per_col_null[col] > 0]
+        numeric = set(df_cleaned.select_dtypes(include=[np.number]).columns)
+        num_cols = [col for col in missing_cols if col in numeric]
+        cat_cols = [col for col in missing_cols if col not in numeric]
+        
+        # Fill numeric with median, computed for all numeric columns in one call
+        fill_values = df_cleaned[num_cols].median().to_dict()
+        for col in num_cols:
+            # Nullable integer columns cannot hold a fractional median
+            if pd.api.types.is_integer_dtype(df_cleaned[col]) and pd.notna(fill_values[col]):
+                fill_values[col] = round(fill_values[col])
+        
+        # Fill categorical with mode or 'Unknown'; the columns are independent,
+        # so their modes are computed concurrently
+        if cat_cols:
+            with ThreadPoolExecutor() as executor:
+                modes = executor.map(_mode_or_unknown, [df_cleaned[col] for col in cat_cols])
+                fill_values.update(zip(cat_cols, modes))
+        
+        for col in cat_cols:
+            if isinstance(df_cleaned[col].dtype, pd.CategoricalDtype):
+                df_cleaned[col] = _add_category(df_cleaned[col], fill_values[col])
+        
+        if clean_text:
+            text_cols = df_cleaned.select_dtypes(include=['object', 'string', 'category']).columns
+            df_cleaned = df_cleaned.fillna({col: val for col, val in fill_values.items() if col not in text_cols})
+            for col in text_cols:
+                series = df_cleaned[col].fillna(fill_values[col]) if col in fill_values else df_cleaned[col]
+                cleaned = strip_text(series)
+                df_cleaned[col] = series if cleaned is None else cleaned
+            logger.info("Cleaned %s text columns", len(text_cols))
+        else:
+            df_cleaned = df_cleaned.fillna(fill_values)
+        for col, fill_val in fill_values.items():
+            logger.debug("Filled %s with: %s", col, fill_val)
+        
+        # Only the filled columns can still hold nulls (e.g. an all-null median)
+        final_missing = int(df_cleaned[missing_cols].isnull().sum().sum())
     
     elif strategy == "drop_rows":
         df_cleaned = df_cleaned.dropna()
-        logger.info(f"Dropped {len(df) - len(df_cleaned)} rows with missing values")
+        final_missing = 0
+        logger.info("Dropped %s rows with missing values", len(df) - len(df_cleaned))
     
     elif strategy == "drop_columns":
         df_cleaned = df_cleaned.dropna(axis=1)
-        logger.info(f"Dropped {len(df.columns) - len(df_cleaned.columns)} columns with missing values")
+        final_missing = 0
+        logger.info("Dropped %s columns with missing values", len(df.columns) - len(df_cleaned.columns))
     
     elif strategy == "fill":
         if fill_value is None:
             raise DataCleaningError("fill_value must be provided when strategy='fill'")
+        for col in df_cleaned.select_dtypes(include=['category']).columns:
+            df_cleaned[col] = _add_category(df_cleaned[col], fill_value)
         df_cleaned = df_cleaned.fillna(fill_value)
-        logger.info(f"Filled all missing values with: {fill_value}")
+        final_missing = 0
+        logger.info("Filled all missing values with: %s", fill_value)
+    
+    logger.info("Final missing values: %s", final_missing)
     
-    final_missing = df_cleaned.isnull().sum().sum()
-    logger.info(f"Final missing values: {final_missing}")
+    if clean_text and strategy != "auto":
+        df_cleaned = clean_text_columns(df_cleaned)
     
     return df_cleaned
 
 
+def _mode_or_unknown(series: pd.Series):
+    """Return the most frequent value of a series, or 'Unknown' if it has none."""
+    mode = series.mode()
+    return 'Unknown' if mode.empty else mode.iloc[0]
+
+
+def _add_category(series: pd.Series, value) -> pd.Series:
+    """Add value to a categorical series' categories if not already present."""
+    if value in series.cat.categories:
+        return series
+    return series.cat.add_categories([value])
+
+
 def standardize_column_names(df: pd.DataFrame) -> pd.DataFrame:
     """
     Standardize column names to lowercase with underscores.
@@ -124,20 +218,96 @@ def standardize_column_names(df: pd.DataFrame) -> pd.DataFrame:
         DataFrame with standardized column names
     """
     original_cols = df.columns.tolist()
-    df.columns = (
-        df.columns.str.strip()
-        .str.lower()
-        .str.replace(r'[^\w\s]', '', regex=True)
-        .str.replace(r'\s+', '_', regex=True)
-    )
+    new_cols = [
+        _WHITESPACE.sub('_', _NON_WORD.sub('', str(col).strip().lower()))
+        for col in original_cols
+    ]
+    df = df.set_axis(new_cols, axis=1)
     
-    logger.info(f"Standardized {len(df.columns)} column names")
-    if original_cols != df.columns.tolist():
-        logger.debug(f"Column name changes: {dict(zip(original_cols, df.columns))}")
+    logger.info("Standardized %s column names", len(new_cols))
+    if logger.isEnabledFor(logging.DEBUG) and original_cols != new_cols:
+        logger.debug("Column name changes: %s", dict(zip(original_cols, new_cols)))
     
     return df
 
 
+def _has_edge_whitespace(series: pd.Series) -> bool:
+    """
+    Check whether any value in a text series has leading or trailing whitespace.
+    
+    A small sample is checked first so dirty columns are detected cheaply;
+    a clean sample is confirmed against the whole column.
+    """
+    def dirty(values: pd.Series) -> bool:
+        return bool(
+            values.str.startswith(_WHITESPACE_CHARS, na=False).any()
+            or values.str.endswith(_WHITESPACE_CHARS, na=False).any()
+        )
+    
+    if len(series) > _WHITESPACE_SAMPLE_SIZE:
+        if dirty(series.sample(n=_WHITESPACE_SAMPLE_SIZE, random_state=0)):
+            return True
+    return dirty(series)
+
+
+def convert_string_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert object columns holding only text to Arrow-backed strings.
+    
+    Arrow strings are stored in contiguous buffers, so the vectorized string
+    methods used by the other cleaning steps run in C++ rather than over
+    Python objects. Columns mixing text with other values are left as is.
+    
+    Args:
+        df: Input dataframe
+        
+    Returns:
+        DataFrame with converted text columns (unchanged if pyarrow is missing)
+    """
+    if pa is None:
+        return df
+    
+    df_cleaned = df.copy(deep=False)
+    converted = 0
+    for col in df_cleaned.select_dtypes(include=['object']).columns:
+        if pd.api.types.infer_dtype(df_cleaned[col], skipna=True) == 'string':
+            df_cleaned[col] = df_cleaned[col].astype('string[pyarrow]')
+            converted += 1
+    
+    logger.info("Converted %s text columns to Arrow strings", converted)
+    return df_cleaned
+
+
+def strip_text(series: pd.Series) -> Optional[pd.Series]:
+    """
+    Strip edge whitespace from a text or categorical column.
+    
+    Args:
+        series: Input column; other dtypes are left alone
+    
+    Returns:
+        The stripped column, or None if it needs no change
+    """
+    if series.dtype == 'object' or isinstance(series.dtype, pd.StringDtype):
+        # Strip whitespace, leaving already-clean columns untouched
+        if _has_edge_whitespace(series):
+            return series.str.strip()
+    elif isinstance(series.dtype, pd.CategoricalDtype) and series.cat.categories.dtype == 'object':
+        # Strip the categories once rather than every value; stripping may
+        # merge categories, so the codes are remapped onto the stripped set.
+        # Remapped codes are valid by construction, so from_codes skips its
+        # validation scan over them
+        remap, categories = pd.factorize(series.cat.categories.map(str.strip), sort=True)
+        # Missing values (code -1) index the appended -1 and stay missing
+        codes = np.append(remap, -1)[series.cat.codes.to_numpy()]
+        return pd.Series(
+            pd.Categorical.from_codes(codes, categories, validate=False),
+            index=series.index,
+            name=series.name
+        )
+    return None
+
+
 def clean_text_columns(
     df: pd.DataFrame,
     columns: Optional[List[str]] = None
@@ -147,26 +317,47 @@ def clean_text_columns(
     
     Args:
         df: Input dataframe
-        columns: Specific columns to clean (default: all object columns)
+        columns: Specific columns to clean (default: all text columns)
         
     Returns:
         DataFrame with cleaned text columns
     """
-    df_cleaned = df.copy()
+    df_cleaned = df.copy(deep=False)
     
     if columns is None:
-        columns = df_cleaned.select_dtypes(include=['object']).columns.tolist()
+        columns = df_cleaned.select_dtypes(include=['object', 'string', 'category']).columns.tolist()
     
     for col in columns:
-        if col in df_cleaned.columns and df_cleaned[col].dtype == 'object':
-            # Strip whitespace
-            df_cleaned[col] = df_cleaned[col].str.strip()
-            logger.debug(f"Cleaned text column: {col}")
+        if col not in df_cleaned.columns:
+            continue
+        cleaned = strip_text(df_cleaned[col])
+        if cleaned is not None:
+            df_cleaned[col] = cleaned
+            logger.debug("Cleaned text column: %s", col)
     
-    logger.info(f"Cleaned {len(columns)} text columns")
+    logger.info("Cleaned %s text columns", len(columns))
     return df_cleaned
 
 
+def _detect_date_format(
+    values: pd.Series,
+    formats: List[str],
+    sample_size: int = DATE_SAMPLE_SIZE
+) -> Optional[str]:
+    """Return the first format that parses >99% of a sample of values, if any."""
+    sample = values.dropna()
+    if sample.empty:
+        return None
+    if len(sample) > sample_size:
+        sample = sample.sample(n=sample_size, random_state=0)
+    
+    for fmt in formats:
+        parsed = pd.to_datetime(sample, format=fmt, errors='coerce')
+        if parsed.notna().mean() > 0.99:
+            return fmt
+    return None
+
+
 def parse_dates(
     df: pd.DataFrame,
     date_columns: List[str],
@@ -175,6 +366,10 @@ def parse_dates(
     """
     Parse date columns with multiple format attempts.
     
+    Each column's format is detected on a sample of its values, so the full
+    column is parsed only once. Columns that mix formats fall back to
+    per-value format inference.
+    
     Args:
         df: Input dataframe
         date_columns: List of column names containing dates
@@ -183,30 +378,24 @@ def parse_dates(
     Returns:
         DataFrame with parsed date columns
     """
-    df_cleaned = df.copy()
+    df_cleaned = df.copy(deep=False)
     
     for col in date_columns:
         if col not in df_cleaned.columns:
-            logger.warning(f"Date column '{col}' not found in dataframe")
+            logger.warning("Date column '%s' not found in dataframe", col)
             continue
         
-        parsed = False
-        for fmt in formats:
-            try:
+        fmt = _detect_date_format(df_cleaned[col], formats)
+        try:
+            if fmt is not None:
                 df_cleaned[col] = pd.to_datetime(df_cleaned[col], format=fmt, errors='coerce')
-                logger.info(f"Parsed date column '{col}' with format: {fmt}")
-                parsed = True
-                break
-            except:
-                continue
-        
-        if not parsed:
-            # Try pandas automatic parsing as fallback
-            try:
-                df_cleaned[col] = pd.to_datetime(df_cleaned[col], errors='coerce')
-                logger.info(f"Parsed date column '{col}' with automatic format detection")
-            except Exception as e:
-                logger.warning(f"Failed to parse date column '{col}': {str(e)}")
+                logger.info("Parsed date column '%s' with format: %s", col, fmt)
+            else:
+                # No single format fits, so let pandas infer the format per value
+                df_cleaned[col] = pd.to_datetime(df_cleaned[col], format='mixed', errors='coerce')
+                logger.info("Parsed date column '%s' with mixed format detection", col)
+        except (ValueError, TypeError) as e:
+            logger.warning("Failed to parse date column '%s': %s", col, e)
     
     return df_cleaned
 
@@ -220,6 +409,9 @@ def remove_outliers(
     """
     Remove outliers from numeric columns.
     
+    Bounds for every column are computed on the input frame, and a row is
+    removed if any of its columns falls outside them.
+    
     Args:
         df: Input dataframe
         columns: Specific columns to check (default: all numeric columns)
@@ -229,41 +421,38 @@ def remove_outliers(
     Returns:
         DataFrame with outliers removed
     """
-    df_cleaned = df.copy()
-    initial_rows = len(df_cleaned)
+    initial_rows = len(df)
     
     if columns is None:
-        columns = df_cleaned.select_dtypes(include=[np.number]).columns.tolist()
+        columns = df.select_dtypes(include=[np.number]).columns.tolist()
+    columns = [col for col in columns if col in df.columns]
     
-    for col in columns:
-        if col not in df_cleaned.columns:
-            continue
-        
+    if not columns or method not in ("iqr", "zscore"):
+        return df
+    
+    values = df[columns].to_numpy(dtype=float, na_value=np.nan)
+    
+    # NaN compares False, so rows with missing values are treated as outliers
+    with np.errstate(divide='ignore', invalid='ignore'):
         if method == "iqr":
-            Q1 = df_cleaned[col].quantile(0.25)
-            Q3 = df_cleaned[col].quantile(0.75)
+            Q1, Q3 = np.nanpercentile(values, [25, 75], axis=0)
             IQR = Q3 - Q1
-            lower_bound = Q1 - threshold * IQR
-            upper_bound = Q3 + threshold * IQR
-            
-            mask = (df_cleaned[col] >= lower_bound) & (df_cleaned[col] <= upper_bound)
-            outliers = (~mask).sum()
-            df_cleaned = df_cleaned[mask]
-            
-            if outliers > 0:
-                logger.info(f"Removed {outliers} outliers from '{col}' using IQR method")
-        
-        elif method == "zscore":
-            z_scores = np.abs((df_cleaned[col] - df_cleaned[col].mean()) / df_cleaned[col].std())
-            mask = z_scores <= threshold
-            outliers = (~mask).sum()
-            df_cleaned = df_cleaned[mask]
-            
-            if outliers > 0:
-                logger.info(f"Removed {outliers} outliers from '{col}' using Z-score method")
+            in_range = (values >= Q1 - threshold * IQR) & (values <= Q3 + threshold * IQR)
+            method_name = "IQR"
+        else:
+            mean = np.nanmean(values, axis=0)
+            std = np.nanstd(values, axis=0, ddof=1)
+            in_range = np.abs((values - mean) / std) <= threshold
+            method_name = "Z-score"
+    
+    for col, outliers in zip(columns, (~in_range).sum(axis=0)):
+        if outliers > 0:
+            logger.info("Flagged %s outliers in '%s' using %s method", outliers, col, method_name)
+    
+    df_cleaned = df[in_range.all(axis=1)]
     
     total_outliers = initial_rows - len(df_cleaned)
     if total_outliers > 0:
-        logger.info(f"Total outliers removed: {total_outliers} ({total_outliers/initial_rows*100:.2f}%)")
+        logger.info("Total outliers removed: %s (%.2f%%)", total_outliers, total_outliers/initial_rows*100)
     
     return df_cleaned
@@ -19,6 +19,18 @@ for directory in [RAW_DATA_DIR, PROCESSED_DATA_DIR, SAMPLE_DATA_DIR, LOGS_DIR]:
 MISSING_VALUE_THRESHOLD = 0.5  # Drop columns with >50% missing values
 DUPLICATE_SUBSET = None  # Check all columns for duplicates (None = all columns)
 
+# Ingestion settings
+CSV_BLOCK_SIZE = 8 << 20  # Bytes per block for the multithreaded Arrow CSV reader
+
+# Dask backend settings
+DASK_BLOCKSIZE = "128MB"  # CSV bytes per partition when reading with Dask
+
+# Chunked backend settings
+STREAM_CHUNKSIZE = 100_000  # Rows per chunk when streaming a file through the pipeline
+
+# Export settings
+EXPORT_CHUNKSIZE = 100_000  # Rows written per batch when exporting
+
 # Date formats to try when parsing dates
 DATE_FORMATS = [
     "%Y-%m-%d",
@@ -28,6 +40,7 @@ DATE_FORMATS = [
     "%d-%m-%Y",
     "%m-%d-%Y",
 ]
+DATE_SAMPLE_SIZE = 1000  # Values sampled per column to detect its date format
 
 # Logging configuration
 LOG_LEVEL = "INFO"
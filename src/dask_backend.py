@@ -0,0 +1,279 @@
+"""Dask execution backend for inputs that do not fit in memory."""
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+import numpy as np
+
+try:
+    import dask
+    import dask.dataframe as dd
+except ImportError:
+    dask = None
+    dd = None
+
+from .cleaning import standardize_column_names, parse_dates, strip_text
+from .config import MISSING_VALUE_THRESHOLD, DASK_BLOCKSIZE
+from .logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def _require_dask() -> None:
+    """Raise a helpful error if dask is not installed."""
+    if dd is None:
+        raise ImportError("backend='dask' requires the dask[dataframe] package")
+
+
+def ingest_dask(file_path: Path, blocksize: str = DASK_BLOCKSIZE) -> "dd.DataFrame":
+    """
+    Lazily read a CSV or Parquet file into a partitioned Dask dataframe.
+    
+    Args:
+        file_path: Path to the data file
+        blocksize: Bytes of CSV text per partition
+    
+    Returns:
+        Dask dataframe backed by the file
+    """
+    _require_dask()
+    logger.info("Opening %s with Dask (blocksize=%s)", file_path, blocksize)
+    
+    if file_path.suffix == ".parquet":
+        return dd.read_parquet(file_path)
+    return dd.read_csv(file_path, blocksize=blocksize)
+
+
+def clean_dask(
+    ddf: "dd.DataFrame",
+    remove_duplicates_flag: bool = True,
+    missing_value_strategy: str = "auto",
+    standardize_columns: bool = True,
+    date_columns: Optional[List[str]] = None,
+    remove_outliers_flag: bool = False,
+    outlier_columns: Optional[List[str]] = None,
+    threshold: float = MISSING_VALUE_THRESHOLD,
+    iqr_multiplier: float = 1.5
+) -> "dd.DataFrame":
+    """
+    Apply the pipeline's cleaning steps to a Dask dataframe.
+    
+    Row-local steps run per partition with the pandas cleaning functions;
+    steps that need global statistics (imputation, outlier bounds) compute
+    those statistics first and then apply them partition by partition.
+    
+    Args:
+        ddf: Input Dask dataframe
+        remove_duplicates_flag: Whether to remove duplicate rows
+        missing_value_strategy: 'auto', 'drop_rows' or 'drop_columns'
+        standardize_columns: Whether to standardize column names
+        date_columns: List of columns to parse as dates
+        remove_outliers_flag: Whether to remove outliers (IQR method)
+        outlier_columns: Specific columns to check for outliers
+        threshold: Fraction of missing values above which 'auto' drops a column
+        iqr_multiplier: IQR multiplier for outlier bounds
+    
+    Returns:
+        Lazily cleaned Dask dataframe
+    """
+    _require_dask()
+    
+    if standardize_columns:
+        new_columns = standardize_column_names(pd.DataFrame(columns=ddf.columns)).columns
+        ddf = ddf.rename(columns=dict(zip(ddf.columns, new_columns)))
+    
+    if remove_duplicates_flag:
+        ddf = ddf.drop_duplicates(split_out=ddf.npartitions)
+    
+    if missing_value_strategy == "auto":
+        missing_frac = ddf.isna().mean().compute()
+        cols_to_drop = missing_frac[missing_frac > threshold].index.tolist()
+        if cols_to_drop:
+            logger.info("Dropping columns with >%s%% missing: %s", threshold * 100, cols_to_drop)
+            ddf = ddf.drop(columns=cols_to_drop)
+        
+        missing_cols = [col for col in missing_frac[missing_frac > 0].index if col in ddf.columns]
+        numeric = set(ddf.select_dtypes(include=[np.number]).columns)
+        num_cols = [col for col in missing_cols if col in numeric]
+        cat_cols = [col for col in missing_cols if col not in numeric]
+        
+        # One graph computes every median and mode together
+        medians, *modes = dask.compute(
+            ddf[num_cols].quantile(0.5) if num_cols else pd.Series(dtype=float),
+            *[ddf[col].mode() for col in cat_cols]
+        )
+        fill_values = medians.to_dict()
+        for col, mode in zip(cat_cols, modes):
+            fill_values[col] = 'Unknown' if mode.empty else mode.iloc[0]
+        ddf = ddf.fillna(fill_values)
+    
+    elif missing_value_strategy == "drop_rows":
+        ddf = ddf.dropna()
+    
+    elif missing_value_strategy == "drop_columns":
+        null_counts = ddf.isna().sum().compute()
+        ddf = ddf.drop(columns=null_counts[null_counts > 0].index.tolist())
+    
+    else:
+        raise ValueError(f"Missing value strategy '{missing_value_strategy}' is not supported by the Dask backend")
+    
+    for col in ddf.select_dtypes(include=['object', 'string', 'category']).columns:
+        stripped = ddf[col].map_partitions(_strip_partition, meta=ddf[col]._meta)
+        # Stripping can merge categories, so they are no longer known up front
+        ddf[col] = stripped.cat.as_unknown() if isinstance(stripped.dtype, pd.CategoricalDtype) else stripped
+    
+    if date_columns:
+        ddf = ddf.map_partitions(parse_dates, date_columns)
+    
+    if remove_outliers_flag:
+        if outlier_columns is None:
+            outlier_columns = ddf.select_dtypes(include=[np.number]).columns.tolist()
+        outlier_columns = [col for col in outlier_columns if col in ddf.columns]
+        if outlier_columns:
+            quartiles = ddf[outlier_columns].quantile([0.25, 0.75]).compute()
+            iqr = quartiles.loc[0.75] - quartiles.loc[0.25]
+            lower = quartiles.loc[0.25] - iqr_multiplier * iqr
+            upper = quartiles.loc[0.75] + iqr_multiplier * iqr
+            ddf = ddf.map_partitions(_filter_bounds, lower, upper)
+    
+    return ddf
+
+
+def _strip_partition(series: pd.Series) -> pd.Series:
+    """Strip edge whitespace from one partition of a text or categorical column."""
+    stripped = strip_text(series)
+    return series if stripped is None else stripped
+
+
+def _filter_bounds(df: pd.DataFrame, lower: pd.Series, upper: pd.Series) -> pd.DataFrame:
+    """Keep rows whose bounded columns all fall within [lower, upper]."""
+    values = df[lower.index]
+    return df[((values >= lower) & (values <= upper)).all(axis=1)]
+
+
+def export_dask_tasks(
+    ddf: "dd.DataFrame",
+    output_dir: Path,
+    stem: str,
+    export_format: str = "csv"
+) -> Tuple[Path, "dd.Series"]:
+    """
+    Build the lazy writes of a Dask dataframe as one file per partition.
+    
+    The writes are a map over the partitions rather than Delayed objects,
+    so they can be computed together with other expressions on ddf.
+    
+    Args:
+        ddf: Dask dataframe to export
+        output_dir: Directory for output files
+        stem: Base name of the output files
+        export_format: 'csv', 'json' (JSON Lines) or 'parquet'
+    
+    Returns:
+        Path of the file glob or Parquet directory, and a lazy series of
+        the rows written per partition to pass to dask.compute
+    """
+    if export_format == "parquet":
+        output_path = output_dir / f"{stem}.parquet"
+        output_path.mkdir(parents=True, exist_ok=True)
+    else:
+        output_path = output_dir / f"{stem}-*.{'json' if export_format == 'json' else 'csv'}"
+    writes = ddf.map_partitions(_write_partition, output_path, export_format, meta=(None, 'int64'))
+    return output_path, writes
+
+
+def _write_partition(df: pd.DataFrame, output_path: Path, export_format: str, partition_info=None) -> pd.Series:
+    """Write one partition, numbered like Dask's own writers, and return its row count."""
+    number = partition_info["number"] if partition_info else 0
+    if export_format == "parquet":
+        df.to_parquet(output_path / f"part.{number}.parquet", index=False)
+    else:
+        path = str(output_path).replace("*", str(number))
+        if export_format == "json":
+            df.to_json(path, orient="records", lines=True)
+        else:
+            df.to_csv(path, index=False)
+    return pd.Series([len(df)])
+
+
+def export_dask(ddf: "dd.DataFrame", output_dir: Path, stem: str, export_format: str = "csv") -> Path:
+    """
+    Write a Dask dataframe as one file per partition.
+    
+    Args:
+        ddf: Dask dataframe to export
+        output_dir: Directory for output files
+        stem: Base name of the output files
+        export_format: 'csv', 'json' (JSON Lines) or 'parquet'
+    
+    Returns:
+        Path of the file glob or Parquet directory written
+    """
+    output_path, writes = export_dask_tasks(ddf, output_dir, stem, export_format)
+    dask.compute(writes)
+    
+    logger.info("Exported Dask partitions to %s", output_path)
+    return output_path
+
+
+def dask_quality_report(ddf: "dd.DataFrame", writes: Any = None) -> Dict[str, Any]:
+    """
+    Build the data quality report from one pass of Dask aggregations.
+    
+    Args:
+        ddf: Input Dask dataframe
+        writes: Lazy write tasks from export_dask_tasks to run in the same
+            pass, so the graph behind ddf is evaluated once for both
+    
+    Returns:
+        Dictionary with the same structure as generate_data_quality_report
+    """
+    numeric_cols = ddf.select_dtypes(include=[np.number]).columns.tolist()
+    numeric = ddf[numeric_cols]
+    
+    nrows, distinct_rows, null_counts, nuniques, means, medians, stds, mins, maxs, _ = dask.compute(
+        ddf.shape[0],
+        ddf.drop_duplicates(split_out=ddf.npartitions).shape[0],
+        ddf.isna().sum(),
+        ddf.nunique(),
+        numeric.mean(),
+        numeric.quantile(0.5),
+        numeric.std(),
+        numeric.min(),
+        numeric.max(),
+        writes
+    )
+    ncols = len(ddf.columns)
+    total_missing = int(null_counts.sum())
+    
+    report = {
+        "total_rows": int(nrows),
+        "total_columns": ncols,
+        "duplicate_rows": int(nrows - distinct_rows),
+        "has_duplicates": bool(distinct_rows < nrows),
+        "columns_with_missing": int((null_counts > 0).sum()),
+        "total_missing_values": total_missing,
+        "missing_percentage": total_missing / (nrows * ncols) * 100 if nrows and ncols else 0.0,
+        "column_stats": {}
+    }
+    
+    for col in ddf.columns:
+        stats = {
+            "dtype": str(ddf[col].dtype),
+            "missing_count": int(null_counts[col]),
+            "missing_percentage": float(null_counts[col] / nrows * 100) if nrows else 0.0,
+            "unique_values": int(nuniques[col])
+        }
+        if col in numeric_cols:
+            all_missing = null_counts[col] == nrows
+            stats.update({
+                name: None if all_missing else float(values[col])
+                for name, values in (("mean", means), ("median", medians), ("std", stds),
+                                     ("min", mins), ("max", maxs))
+            })
+        report["column_stats"][col] = stats
+    
+    logger.info("Generated data quality report: %s rows, %s missing values (%.2f%%)",
+                report['total_rows'], report['total_missing_values'], report['missing_percentage'])
+    return report
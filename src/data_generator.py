@@ -3,9 +3,7 @@
 import pandas as pd
 import numpy as np
 from pathlib import Path
-from datetime import datetime, timedelta
 from typing import Optional
-import random
 
 from .logger import setup_logger
 
@@ -15,69 +13,80 @@ logger = setup_logger(__name__)
 def generate_sample_data(
     num_rows: int = 1000,
     output_path: Optional[Path] = None,
-    messy: bool = True
+    messy: bool = True,
+    file_format: str = "auto"
 ) -> pd.DataFrame:
     """
     Generate sample customer data with various data quality issues.
     
     Args:
         num_rows: Number of rows to generate
-        output_path: Path to save the CSV (optional)
+        output_path: Path to save the data (optional)
         messy: Whether to introduce data quality issues
+        file_format: 'csv', 'parquet', or 'auto' to pick from the output
+            path's suffix. Parquet skips CSV encoding and re-parsing when the
+            file only feeds this pipeline; keep CSV for external tools.
         
     Returns:
         DataFrame with sample data
     """
     logger.info(f"Generating sample data with {num_rows} rows")
     
-    # Set random seed for reproducibility
-    np.random.seed(42)
-    random.seed(42)
+    # Seeded generator for reproducibility
+    rng = np.random.default_rng(42)
+    
+    first_names = np.array([
+        "John", "Jane", "Bob", "Alice", "Charlie", "Diana",
+        "Edward", "Fiona", "George", "Hannah", "Ian", "Julia"
+    ])
+    last_names = np.array([
+        "Smith", "Johnson", "Williams", "Brown", "Jones",
+        "Garcia", "Miller", "Davis", "Rodriguez", "Martinez"
+    ])
+    cities = np.array([
+        "New York", "Los Angeles", "Chicago", "Houston", "Phoenix",
+        "Philadelphia", "San Antonio", "San Diego", "Dallas", "San Jose"
+    ])
+    statuses = np.array(["active", "inactive", "pending", "suspended"])
+    domains = np.array(["gmail.com", "yahoo.com", "hotmail.com", "company.com"])
+    
+    first = rng.choice(first_names, num_rows)
+    last = rng.choice(last_names, num_rows)
+    domain = rng.choice(domains, num_rows)
+    
+    # Generate emails
+    emails = np.char.add(np.char.lower(first), ".")
+    emails = np.char.add(emails, np.char.lower(last))
+    emails = np.char.add(emails, np.arange(num_rows).astype(str))
+    emails = np.char.add(emails, np.char.add("@", domain))
+    
+    # Generate dates (up to 4 years after the start date)
+    start_date = np.datetime64("2020-01-01")
+    dates = pd.to_datetime(
+        start_date + rng.integers(0, 1461, num_rows).astype("timedelta64[D]")
+    )
+    
+    # Mix different date formats if messy, with one categorical draw per row
+    if messy:
+        date_formats = ["%d/%m/%Y", "%m-%d-%Y", "%Y-%m-%d"]
+        fmt_idx = rng.choice(len(date_formats), p=[0.3, 0.3, 0.4], size=num_rows)
+        signup_dates = np.choose(fmt_idx, [dates.strftime(fmt).to_numpy() for fmt in date_formats])
+    else:
+        signup_dates = dates.strftime("%Y-%m-%d").to_numpy()
     
     # Generate base data
     data = {
         "Customer ID": range(1, num_rows + 1),
-        "First Name": [random.choice([
-            "John", "Jane", "Bob", "Alice", "Charlie", "Diana",
-            "Edward", "Fiona", "George", "Hannah", "Ian", "Julia"
-        ]) for _ in range(num_rows)],
-        "Last Name": [random.choice([
-            "Smith", "Johnson", "Williams", "Brown", "Jones",
-            "Garcia", "Miller", "Davis", "Rodriguez", "Martinez"
-        ]) for _ in range(num_rows)],
-        "Email": [],
-        "Age": np.random.randint(18, 80, num_rows),
-        "Signup Date": [],
-        "Purchase Amount": np.random.uniform(10, 1000, num_rows).round(2),
-        "City": [random.choice([
-            "New York", "Los Angeles", "Chicago", "Houston", "Phoenix",
-            "Philadelphia", "San Antonio", "San Diego", "Dallas", "San Jose"
-        ]) for _ in range(num_rows)],
-        "Status": [random.choice([
-            "active", "inactive", "pending", "suspended"
-        ]) for _ in range(num_rows)],
+        "First Name": first,
+        "Last Name": last,
+        "Email": emails,
+        "Age": rng.integers(18, 80, num_rows),
+        "Signup Date": signup_dates,
+        "Purchase Amount": rng.uniform(10, 1000, num_rows).round(2),
+        "City": pd.Categorical(rng.choice(cities, num_rows)),
+        "Status": pd.Categorical(rng.choice(statuses, num_rows)),
     }
     
-    # Generate emails
-    for i in range(num_rows):
-        first = data["First Name"][i].lower()
-        last = data["Last Name"][i].lower()
-        domain = random.choice(["gmail.com", "yahoo.com", "hotmail.com", "company.com"])
-        data["Email"].append(f"{first}.{last}{i}@{domain}")
-    
-    # Generate dates
-    start_date = datetime(2020, 1, 1)
-    for i in range(num_rows):
-        days_offset = random.randint(0, 1460)  # Up to 4 years
-        date = start_date + timedelta(days=days_offset)
-        # Mix different date formats if messy
-        if messy and random.random() < 0.3:
-            data["Signup Date"].append(date.strftime("%d/%m/%Y"))
-        elif messy and random.random() < 0.3:
-            data["Signup Date"].append(date.strftime("%m-%d-%Y"))
-        else:
-            data["Signup Date"].append(date.strftime("%Y-%m-%d"))
-    
     df = pd.DataFrame(data)
     
     if messy:
@@ -85,39 +94,46 @@ def generate_sample_data(
         
         # Add duplicates (5%)
         num_duplicates = int(num_rows * 0.05)
-        duplicate_indices = np.random.choice(df.index, num_duplicates, replace=True)
-        duplicates = df.loc[duplicate_indices].copy()
-        df = pd.concat([df, duplicates], ignore_index=True)
+        duplicate_positions = rng.integers(0, len(df), size=num_duplicates)
+        df = pd.concat([df, df.iloc[duplicate_positions]], ignore_index=True)
         logger.info(f"Added {num_duplicates} duplicate rows")
         
         # Add missing values (10% across various columns)
-        missing_indices = np.random.choice(len(df), int(len(df) * 0.1), replace=False)
-        for idx in missing_indices:
-            col = random.choice(["Email", "Age", "City", "Purchase Amount"])
-            df.loc[idx, col] = np.nan
+        missing_indices = rng.choice(len(df), int(len(df) * 0.1), replace=False)
+        missing_columns = np.array(["Email", "Age", "City", "Purchase Amount"])
+        col_choice = rng.choice(missing_columns, len(missing_indices))
+        for col in missing_columns:
+            df.loc[missing_indices[col_choice == col], col] = np.nan
         logger.info("Added missing values")
         
+        # Categorical columns are mutated as plain strings and re-encoded below
+        categorical_columns = ["City", "Status"]
+        df[categorical_columns] = df[categorical_columns].astype(object)
+        
         # Add whitespace issues
         text_columns = ["First Name", "Last Name", "Email", "City", "Status"]
         for col in text_columns:
-            indices = np.random.choice(len(df), int(len(df) * 0.15), replace=False)
-            for idx in indices:
-                if pd.notna(df.loc[idx, col]):
-                    df.loc[idx, col] = "  " + str(df.loc[idx, col]) + "  "
+            positions = rng.choice(len(df), int(len(df) * 0.15), replace=False)
+            values = df[col].to_numpy()[positions]
+            present = pd.notna(values)
+            padded = np.char.add(np.char.add("  ", values[present].astype(str)), "  ")
+            df.iloc[positions[present], df.columns.get_loc(col)] = padded.astype(object)
         logger.info("Added whitespace issues")
         
         # Add case inconsistencies
-        indices = np.random.choice(len(df), int(len(df) * 0.1), replace=False)
-        for idx in indices:
-            if pd.notna(df.loc[idx, "Status"]):
-                df.loc[idx, "Status"] = df.loc[idx, "Status"].upper()
+        positions = rng.choice(len(df), int(len(df) * 0.1), replace=False)
+        values = df["Status"].to_numpy()[positions]
+        present = pd.notna(values)
+        upper = np.char.upper(values[present].astype(str))
+        df.iloc[positions[present], df.columns.get_loc("Status")] = upper.astype(object)
         logger.info("Added case inconsistencies")
         
+        df[categorical_columns] = df[categorical_columns].astype("category")
+        
         # Add some outliers
-        outlier_indices = np.random.choice(len(df), 10, replace=False)
-        for idx in outlier_indices:
-            df.loc[idx, "Age"] = random.choice([5, 150, -10, 200])
-            df.loc[idx, "Purchase Amount"] = random.choice([0.01, 50000, -100])
+        outlier_indices = rng.choice(len(df), 10, replace=False)
+        df.loc[outlier_indices, "Age"] = rng.choice([5, 150, -10, 200], size=10)
+        df.loc[outlier_indices, "Purchase Amount"] = rng.choice([0.01, 50000, -100], size=10)
         logger.info("Added outliers")
         
         # Mix column name formatting
@@ -136,7 +152,12 @@ def generate_sample_data(
     
     if output_path:
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        df.to_csv(output_path, index=False)
+        if file_format == "auto":
+            file_format = "parquet" if output_path.suffix == ".parquet" else "csv"
+        if file_format == "parquet":
+            df.to_parquet(output_path, index=False, compression="zstd", engine="pyarrow")
+        else:
+            df.to_csv(output_path, index=False)
         logger.info(f"Saved sample data to {output_path}")
     
     logger.info(f"Generated dataframe with {len(df)} rows and {len(df.columns)} columns")
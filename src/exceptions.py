@@ -17,8 +17,20 @@ class DataCleaningError(PipelineError):
 
 
 class DataValidationError(PipelineError):
-    """Raised when data validation fails."""
-    pass
+    """
+    Raised when data validation fails.
+    
+    Validators that collect several failures pass the check name and the
+    individual errors, which are kept on the exception and joined into its
+    message.
+    """
+    
+    def __init__(self, message=None, check=None, errors=None):
+        self.check = check
+        self.errors = list(errors or [])
+        if message is None:
+            message = f"{check} validation failed: " + "; ".join(self.errors)
+        super().__init__(message)
 
 
 class DataExportError(PipelineError):
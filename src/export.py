@@ -1,34 +1,84 @@
 """Data export module for saving cleaned data."""
 
+from datetime import date, datetime
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
+import math
+import numpy as np
 import pandas as pd
 import json
 
+from .config import EXPORT_CHUNKSIZE
 from .exceptions import DataExportError
 from .logger import setup_logger
 
+# Optional faster writers and encoders
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = setup_logger(__name__)
 
+EXPORT_ENGINES = ("auto", "pandas", "polars", "pyarrow")
+
+
+def _resolve_engine(engine: str, kwargs: dict) -> str:
+    """Pick the writer for an export, resolving 'auto' to the fastest available."""
+    if engine not in EXPORT_ENGINES:
+        raise ValueError(f"Unknown export engine '{engine}', expected one of {EXPORT_ENGINES}")
+    if engine == "polars" and pl is None:
+        raise ImportError("engine='polars' requires the polars package")
+    if engine == "pyarrow" and pa is None:
+        raise ImportError("engine='pyarrow' requires the pyarrow package")
+    if engine == "auto":
+        # Extra keyword arguments are pandas writer options
+        return "pyarrow" if pa is not None and not kwargs else "pandas"
+    return engine
+
 
 def export_to_csv(
     df: pd.DataFrame,
     output_path: Path,
     index: bool = False,
+    chunksize: Optional[int] = EXPORT_CHUNKSIZE,
+    engine: str = "pandas",
     **kwargs
 ) -> Path:
     """
     Export dataframe to CSV file.
     
+    Rows are written in batches of ``chunksize`` so the serialized text
+    never has to be held in memory all at once.
+    
     Args:
         df: Dataframe to export
         output_path: Path for the output CSV file
         index: Whether to write row indices (default: False)
+        chunksize: Rows written per batch (default: config.EXPORT_CHUNKSIZE)
+        engine: CSV writer to use ('pandas', 'auto', 'polars' or 'pyarrow').
+            The faster writers format some values differently from pandas
+            (quoted strings, full timestamps), so they are opt-in. 'auto'
+            uses the multithreaded pyarrow writer when it is installed and
+            no pandas-specific kwargs are given, falling back to pandas if
+            Arrow cannot convert or write the data.
         **kwargs: Additional arguments to pass to df.to_csv
-        
+    
     Returns:
         Path to the exported file
-        
+    
     Raises:
         DataExportError: If export fails
     """
@@ -38,7 +88,19 @@ def export_to_csv(
         # Ensure parent directory exists
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        df.to_csv(output_path, index=index, **kwargs)
+        engine = _resolve_engine(engine, kwargs)
+        frame = df.reset_index() if index else df
+        if engine == "pyarrow":
+            try:
+                pacsv.write_csv(pa.Table.from_pandas(frame, preserve_index=False), output_path)
+            except pa.ArrowException as e:
+                logger.debug("Falling back to pandas CSV writer: %s", e)
+                engine = "pandas"
+        elif engine == "polars":
+            pl.from_pandas(frame).write_csv(output_path)
+        
+        if engine == "pandas":
+            df.to_csv(output_path, index=index, chunksize=chunksize, **kwargs)
         
         file_size_mb = output_path.stat().st_size / 1024 / 1024
         logger.info(f"Successfully exported {len(df)} rows to {output_path} ({file_size_mb:.2f} MB)")
@@ -54,20 +116,31 @@ def export_to_json(
     df: pd.DataFrame,
     output_path: Path,
     orient: str = "records",
+    lines: bool = False,
+    chunksize: int = EXPORT_CHUNKSIZE,
+    engine: str = "pandas",
     **kwargs
 ) -> Path:
     """
     Export dataframe to JSON file.
     
+    With ``lines=True`` the output is JSON Lines and is written in batches
+    of ``chunksize`` rows, which keeps peak memory bounded for large frames.
+    
     Args:
         df: Dataframe to export
         output_path: Path for the output JSON file
         orient: Format of JSON string (default: 'records')
+        lines: Write one JSON record per line (requires orient='records')
+        chunksize: Rows written per batch when lines=True
+        engine: JSON writer to use ('pandas' or 'polars'). Polars writes
+            JSON Lines natively; it is only used when lines=True and ignores
+            any extra kwargs
         **kwargs: Additional arguments to pass to df.to_json
-        
+    
     Returns:
         Path to the exported file
-        
+    
     Raises:
         DataExportError: If export fails
     """
@@ -77,7 +150,25 @@ def export_to_json(
         # Ensure parent directory exists
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        df.to_json(output_path, orient=orient, **kwargs)
+        if engine not in ("pandas", "polars"):
+            raise ValueError(f"Unknown JSON export engine '{engine}'")
+        
+        if lines:
+            if orient != "records":
+                raise ValueError("lines=True requires orient='records'")
+            if engine == "polars":
+                if pl is None:
+                    raise ImportError("engine='polars' requires the polars package")
+                pl.from_pandas(df).write_ndjson(output_path)
+            else:
+                # Truncate first so every chunk can be appended
+                output_path.write_text("")
+                for start in range(0, len(df), chunksize):
+                    df.iloc[start:start + chunksize].to_json(
+                        output_path, orient=orient, lines=True, mode="a", **kwargs
+                    )
+        else:
+            df.to_json(output_path, orient=orient, **kwargs)
         
         file_size_mb = output_path.stat().st_size / 1024 / 1024
         logger.info(f"Successfully exported {len(df)} rows to {output_path} ({file_size_mb:.2f} MB)")
@@ -89,6 +180,77 @@ def export_to_json(
         raise DataExportError(error_msg) from e
 
 
+def export_to_parquet(
+    df: pd.DataFrame,
+    output_path: Path,
+    compression: str = "zstd",
+    **kwargs
+) -> Path:
+    """
+    Export dataframe to a Parquet file.
+    
+    Parquet is the preferred format for large frames: it is columnar and
+    compressed, so it writes and re-reads much faster than CSV or JSON and
+    keeps the column dtypes.
+    
+    Args:
+        df: Dataframe to export
+        output_path: Path for the output Parquet file
+        compression: Parquet compression codec (default: zstd)
+        **kwargs: Additional arguments to pass to pyarrow.parquet.write_table
+    
+    Returns:
+        Path to the exported file
+    
+    Raises:
+        DataExportError: If export fails
+    """
+    logger.info(f"Exporting data to Parquet: {output_path}")
+    
+    try:
+        if pa is None:
+            raise ImportError("Parquet export requires the pyarrow package")
+        
+        # Ensure parent directory exists
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        pq.write_table(table, output_path, compression=compression, **kwargs)
+        
+        file_size_mb = output_path.stat().st_size / 1024 / 1024
+        logger.info(f"Successfully exported {len(df)} rows to {output_path} ({file_size_mb:.2f} MB)")
+        
+        return output_path
+    except Exception as e:
+        error_msg = f"Failed to export to Parquet: {str(e)}"
+        logger.error(error_msg)
+        raise DataExportError(error_msg) from e
+
+
+def _to_json_compatible(value: Any) -> Any:
+    """
+    Convert NumPy values, NaN and datetimes the way orjson serializes them.
+    
+    Without this the standard json module writes NumPy scalars through
+    default=str (as strings) and NaN as a bare token, which is not valid JSON.
+    """
+    if isinstance(value, dict):
+        return {
+            (key.item() if isinstance(key, np.generic) else key): _to_json_compatible(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return [_to_json_compatible(item) for item in value]
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    # Exact types only: orjson writes subclasses such as pd.Timestamp via str()
+    if type(value) in (date, datetime):
+        return value.isoformat()
+    return value
+
+
 def export_summary_report(
     quality_report: dict,
     output_path: Path
@@ -99,10 +261,10 @@ def export_summary_report(
     Args:
         quality_report: Data quality report dictionary
         output_path: Path for the output JSON file
-        
+    
     Returns:
         Path to the exported file
-        
+    
     Raises:
         DataExportError: If export fails
     """
@@ -112,8 +274,15 @@ def export_summary_report(
         # Ensure parent directory exists
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_path, 'w') as f:
-            json.dump(quality_report, f, indent=2, default=str)
+        if orjson is not None:
+            output_path.write_bytes(orjson.dumps(
+                quality_report,
+                default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            ))
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(_to_json_compatible(quality_report), f, indent=2, ensure_ascii=False, default=str)
         
         logger.info(f"Successfully exported quality report to {output_path}")
         
@@ -1,45 +1,133 @@
 """Data ingestion module for loading raw data."""
 
+import logging
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional, Union
 import pandas as pd
 
+from .config import CSV_BLOCK_SIZE
 from .exceptions import DataIngestionError
 from .logger import setup_logger
 
+# Optional multithreaded CSV reader
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+
 logger = setup_logger(__name__)
 
+INGEST_BACKENDS = ("pandas", "pyarrow", "arrow")
+
+
+def _arrow_column_types(schema: Dict[str, Any]) -> Dict[str, "pa.DataType"]:
+    """Translate pandas dtypes to Arrow types; raises for dtypes Arrow's reader cannot produce."""
+    column_types = {}
+    for col, dtype in schema.items():
+        dtype = pd.api.types.pandas_dtype(dtype)
+        if isinstance(dtype, pd.CategoricalDtype):
+            column_types[col] = pa.dictionary(pa.int32(), pa.string())
+        elif pd.api.types.is_string_dtype(dtype):
+            column_types[col] = pa.string()
+        else:
+            column_types[col] = pa.from_numpy_dtype(dtype)
+    return column_types
+
+
+def _read_csv_arrow(
+    file_path: Path,
+    encoding: str,
+    columns: Optional[List[str]] = None,
+    column_types: Optional[Dict[str, "pa.DataType"]] = None
+) -> "pa.Table":
+    """Read a CSV file into an Arrow Table with the multithreaded reader."""
+    read_options = pacsv.ReadOptions(use_threads=True, block_size=CSV_BLOCK_SIZE, encoding=encoding)
+    # Empty fields are missing values, as with pd.read_csv
+    convert_options = pacsv.ConvertOptions(
+        strings_can_be_null=True,
+        include_columns=columns,
+        column_types=column_types
+    )
+    return pacsv.read_csv(file_path, read_options=read_options, convert_options=convert_options)
+
 
 def ingest_csv(
     file_path: Path,
     encoding: str = "utf-8",
+    columns: Optional[List[str]] = None,
+    schema: Optional[Dict[str, Any]] = None,
+    backend: str = "pandas",
     **kwargs
-) -> pd.DataFrame:
+) -> Union[pd.DataFrame, "pa.Table"]:
     """
     Ingest CSV data from a file.
     
+    By default the file is parsed by pd.read_csv. ``backend='pyarrow'``
+    parses it with Arrow's multithreaded reader instead and hands it to
+    pandas without an extra copy; Arrow infers types differently (ISO dates
+    become date objects, for example), so it is opt-in. Passing ``columns``
+    and ``schema`` skips parsing unused columns and type inference.
+    
     Args:
         file_path: Path to the CSV file
         encoding: Character encoding (default: utf-8)
-        **kwargs: Additional arguments to pass to pd.read_csv
-        
+        columns: Columns to read (default: all columns)
+        schema: Dictionary mapping column names to dtypes, skipping type
+            inference for those columns
+        backend: 'pandas' (pd.read_csv) or 'pyarrow' (Arrow's reader) to
+            return a DataFrame, 'arrow' to return a pyarrow Table
+        **kwargs: Additional arguments to pass to pd.read_csv (pandas backend only)
+    
     Returns:
-        DataFrame containing the raw data
-        
+        DataFrame (or Arrow Table) containing the raw data
+    
     Raises:
         DataIngestionError: If file cannot be read or parsed
     """
-    logger.info(f"Starting data ingestion from {file_path}")
+    if backend not in INGEST_BACKENDS:
+        raise ValueError(f"Unknown ingestion backend '{backend}', expected one of {INGEST_BACKENDS}")
+    if backend != "pandas" and (pa is None or kwargs):
+        raise ValueError(f"backend='{backend}' requires pyarrow and takes no pandas reader options")
+    
+    logger.info("Starting data ingestion from %s", file_path)
     
     if not file_path.exists():
         error_msg = f"File not found: {file_path}"
         logger.error(error_msg)
         raise DataIngestionError(error_msg)
     
+    use_arrow = backend != "pandas"
+    column_types = None
+    if use_arrow and schema:
+        try:
+            column_types = _arrow_column_types(schema)
+        except (TypeError, ValueError, NotImplementedError, pa.ArrowException):
+            # e.g. nullable extension dtypes, which only pd.read_csv produces
+            if backend == "arrow":
+                raise
+            use_arrow = False
+    
     try:
-        df = pd.read_csv(file_path, encoding=encoding, **kwargs)
-        logger.info(f"Successfully ingested {len(df)} rows and {len(df.columns)} columns")
-        logger.debug(f"Columns: {list(df.columns)}")
+        if use_arrow:
+            table = _read_csv_arrow(file_path, encoding, columns, column_types)
+            if backend == "arrow":
+                logger.info("Successfully ingested %s rows and %s columns", table.num_rows, table.num_columns)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Columns: %s", table.column_names)
+                return table
+            df = table.to_pandas(split_blocks=True, self_destruct=True)
+            del table
+            if schema:
+                # Arrow strings arrive as object; apply requested extension dtypes
+                mismatched = {col: dtype for col, dtype in schema.items() if col in df and df[col].dtype != dtype}
+                if mismatched:
+                    df = df.astype(mismatched)
+        else:
+            df = pd.read_csv(file_path, encoding=encoding, usecols=columns, dtype=schema, **kwargs)
+        logger.info("Successfully ingested %s rows and %s columns", len(df), len(df.columns))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Columns: %s", list(df.columns))
         return df
     except Exception as e:
         error_msg = f"Failed to read CSV file: {str(e)}"
@@ -47,24 +135,96 @@ def ingest_csv(
         raise DataIngestionError(error_msg) from e
 
 
-def get_data_info(df: pd.DataFrame) -> dict:
+def ingest_parquet(
+    file_path: Path,
+    columns: Optional[List[str]] = None,
+    **kwargs
+) -> pd.DataFrame:
+    """
+    Ingest Parquet data from a file.
+    
+    Args:
+        file_path: Path to the Parquet file
+        columns: Columns to read (default: all columns)
+        **kwargs: Additional arguments to pass to pd.read_parquet
+    
+    Returns:
+        DataFrame containing the raw data
+    
+    Raises:
+        DataIngestionError: If file cannot be read
+    """
+    logger.info("Starting data ingestion from %s", file_path)
+    
+    if not file_path.exists():
+        error_msg = f"File not found: {file_path}"
+        logger.error(error_msg)
+        raise DataIngestionError(error_msg)
+    
+    try:
+        df = pd.read_parquet(file_path, columns=columns, **kwargs)
+        logger.info("Successfully ingested %s rows and %s columns", len(df), len(df.columns))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Columns: %s", list(df.columns))
+        return df
+    except Exception as e:
+        error_msg = f"Failed to read Parquet file: {str(e)}"
+        logger.error(error_msg)
+        raise DataIngestionError(error_msg) from e
+
+
+def ingest_file(file_path: Path, **kwargs) -> pd.DataFrame:
+    """
+    Ingest data from a CSV or Parquet file, chosen by the file suffix.
+    
+    Args:
+        file_path: Path to the data file
+        **kwargs: Additional arguments for the format-specific reader
+    
+    Returns:
+        DataFrame containing the raw data
+    """
+    if file_path.suffix == ".parquet":
+        return ingest_parquet(file_path, **kwargs)
+    return ingest_csv(file_path, **kwargs)
+
+
+def get_data_info(df: Union[pd.DataFrame, "pa.Table"], deep_memory: bool = False) -> dict:
     """
     Get summary information about the dataframe.
     
     Args:
-        df: Input dataframe
-        
+        df: Input dataframe or Arrow Table
+        deep_memory: Include the size of the Python objects held by object
+            columns in memory_usage_mb. This walks every string, so it is
+            off by default and the figure then counts only the column arrays
+    
     Returns:
         Dictionary with data statistics
     """
+    if pa is not None and isinstance(df, pa.Table):
+        info = {
+            "rows": df.num_rows,
+            "columns": df.num_columns,
+            "column_names": df.column_names,
+            "dtypes": dict(zip(df.column_names, df.schema.types)),
+            "missing_values": {name: df.column(name).null_count for name in df.column_names},
+            "memory_usage_mb": df.nbytes / 1024 / 1024
+        }
+        logger.info("Data info: %s rows, %s columns", info['rows'], info['columns'])
+        return info
+    
+    nrows, ncols = df.shape
+    dtypes = df.dtypes
+    null_counts = df.isnull().sum()
     info = {
-        "rows": len(df),
-        "columns": len(df.columns),
+        "rows": nrows,
+        "columns": ncols,
         "column_names": list(df.columns),
-        "dtypes": df.dtypes.to_dict(),
-        "missing_values": df.isnull().sum().to_dict(),
-        "memory_usage_mb": df.memory_usage(deep=True).sum() / 1024 / 1024
+        "dtypes": dict(zip(dtypes.index, dtypes.values)),
+        "missing_values": dict(zip(null_counts.index, null_counts.tolist())),
+        "memory_usage_mb": df.memory_usage(deep=deep_memory).sum() / 1024 / 1024
     }
     
-    logger.info(f"Data info: {info['rows']} rows, {info['columns']} columns")
+    logger.info("Data info: %s rows, %s columns", info['rows'], info['columns'])
     return info
@@ -1,12 +1,63 @@
 """Logging configuration for the data cleaning pipeline."""
 
+import atexit
+import copy
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from .config import LOG_LEVEL, LOG_FORMAT, LOG_FILE
 
+# Argument types that cannot change between enqueueing and formatting
+_IMMUTABLE_ARG_TYPES = (str, bytes, int, float, bool, type(None), Path)
+
+# One background listener per distinct handler configuration
+_listeners: Dict[Tuple[Path, str, int], Tuple[queue.Queue, QueueListener]] = {}
+
+
+class _RawQueueHandler(QueueHandler):
+    """QueueHandler that leaves formatting to the listener's handlers."""
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Enqueue a copy of the raw record instead of a formatted one.
+        
+        Arguments are merged into the message on the calling thread only
+        when they are mutable and could change before the listener runs.
+        """
+        record = copy.copy(record)
+        args = record.args
+        if args and not (isinstance(args, tuple) and all(isinstance(arg, _IMMUTABLE_ARG_TYPES) for arg in args)):
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+
+def _get_log_queue(log_file: Path, log_format: str, level: int) -> queue.Queue:
+    """
+    Return the queue whose listener thread writes to the console and log_file.
+    
+    The listener owns the stream and file handlers, so formatting and writing
+    happen off the calling thread.
+    """
+    key = (log_file, log_format, level)
+    if key not in _listeners:
+        formatter = logging.Formatter(log_format)
+        handlers = [logging.StreamHandler(sys.stdout), logging.FileHandler(log_file)]
+        for handler in handlers:
+            handler.setLevel(level)
+            handler.setFormatter(formatter)
+        
+        log_queue = queue.Queue(-1)
+        listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
+        _listeners[key] = (log_queue, listener)
+    return _listeners[key][0]
+
 
 def setup_logger(
     name: str,
@@ -17,12 +68,15 @@ def setup_logger(
     """
     Set up a logger with both file and console handlers.
     
+    The logger itself only enqueues records; a background listener thread
+    formats them and writes them to the console and the log file.
+    
     Args:
         name: Name of the logger
         log_file: Path to log file (default: uses config.LOG_FILE)
         level: Logging level (default: INFO)
         log_format: Log message format
-        
+    
     Returns:
         Configured logger instance
     """
@@ -33,21 +87,10 @@ def setup_logger(
     if logger.handlers:
         return logger
     
-    formatter = logging.Formatter(log_format)
-    
-    # Console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(getattr(logging, level.upper()))
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
-    
-    # File handler
     if log_file is None:
         log_file = LOG_FILE
     
-    file_handler = logging.FileHandler(log_file)
-    file_handler.setLevel(getattr(logging, level.upper()))
-    file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+    log_queue = _get_log_queue(Path(log_file), log_format, getattr(logging, level.upper()))
+    logger.addHandler(_RawQueueHandler(log_queue))
     
     return logger
@@ -1,38 +1,37 @@
 """Main pipeline orchestrator that coordinates the ETL process."""
 
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Union
 import pandas as pd
 
-from .ingestion import ingest_csv, get_data_info
+from .ingestion import ingest_file, get_data_info
 from .cleaning import (
     remove_duplicates,
     handle_missing_values,
     standardize_column_names,
-    clean_text_columns,
+    convert_string_columns,
     parse_dates,
     remove_outliers
 )
-from .validation import (
-    validate_schema,
-    validate_data_types,
-    validate_ranges,
-    validate_completeness,
-    generate_data_quality_report
-)
-from .export import export_to_csv, export_to_json, export_summary_report
+from .validation import run_validations, generate_data_quality_report
+from .export import export_to_csv, export_to_json, export_to_parquet, export_summary_report
+from .dask_backend import ingest_dask, clean_dask, dask_quality_report, export_dask_tasks
+from .arrow_backend import ingest_arrow, clean_arrow, export_arrow
+from .streaming import ingest_chunks, clean_chunk, SeenRows, RunningQualityReport, export_chunk
 from .logger import setup_logger
 from .exceptions import PipelineError
 
 logger = setup_logger(__name__)
 
+PIPELINE_BACKENDS = ("pandas", "dask", "chunked", "arrow")
+
 
 class DataCleaningPipeline:
     """
     Main ETL pipeline for data cleaning and validation.
     
     This pipeline provides a complete workflow for:
-    1. Ingesting raw CSV data
+    1. Ingesting raw CSV or Parquet data
     2. Cleaning and standardizing the data
     3. Validating data quality
     4. Exporting cleaned data and quality reports
@@ -42,17 +41,26 @@ class DataCleaningPipeline:
         self,
         input_path: Path,
         output_dir: Path,
-        output_filename: str = "cleaned_data.csv"
+        output_filename: str = "cleaned_data.csv",
+        backend: str = "pandas"
     ):
         """
         Initialize the pipeline.
         
         Args:
-            input_path: Path to the raw data CSV file
+            input_path: Path to the raw data file (CSV or Parquet)
             output_dir: Directory for output files
             output_filename: Name for the cleaned data file
+            backend: 'pandas' to process the data in memory, 'dask' to
+                process inputs larger than memory in partitions, 'chunked'
+                to stream the input through the cleaning steps chunk by chunk,
+                or 'arrow' to keep the data in a pyarrow Table throughout
         """
+        if backend not in PIPELINE_BACKENDS:
+            raise ValueError(f"Unknown backend '{backend}', expected one of {PIPELINE_BACKENDS}")
+        
         self.input_path = input_path
+        self.backend = backend
         self.output_dir = output_dir
         self.output_filename = output_filename
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -61,7 +69,7 @@ class DataCleaningPipeline:
         self.cleaned_data: Optional[pd.DataFrame] = None
         self.quality_report: Optional[Dict[str, Any]] = None
         
-        logger.info(f"Initialized pipeline: {input_path} -> {output_dir / output_filename}")
+        logger.info("Initialized pipeline: %s -> %s", input_path, output_dir / output_filename)
     
     def run(
         self,
@@ -71,8 +79,9 @@ class DataCleaningPipeline:
         date_columns: Optional[List[str]] = None,
         remove_outliers_flag: bool = False,
         outlier_columns: Optional[List[str]] = None,
-        export_format: str = "csv"
-    ) -> pd.DataFrame:
+        export_format: str = "csv",
+        validation_rules: Optional[Dict[str, Any]] = None
+    ) -> Union[pd.DataFrame, "dd.DataFrame", "pa.Table", None]:
         """
         Run the complete data cleaning pipeline.
         
@@ -83,11 +92,19 @@ class DataCleaningPipeline:
             date_columns: List of columns to parse as dates
             remove_outliers_flag: Whether to remove outliers
             outlier_columns: Specific columns to check for outliers
-            export_format: Export format ('csv' or 'json')
-            
+            export_format: Export format ('csv', 'json' or 'parquet'; Parquet
+                is preferred for large outputs)
+            validation_rules: Keyword arguments for run_validations (e.g.
+                {'schema': [...], 'ranges': {...}}), checked against the
+                cleaned data before export (pandas backend only)
+        
         Returns:
-            Cleaned dataframe
-            
+            Cleaned data: a pandas DataFrame on the pandas backend, a lazy
+            Dask dataframe on the dask backend (calling .compute() on it
+            evaluates the cleaning graph again), a pyarrow Table on the
+            arrow backend, and None on the chunked backend, which does not
+            keep the cleaned rows
+        
         Raises:
             PipelineError: If any step in the pipeline fails
         """
@@ -96,17 +113,57 @@ class DataCleaningPipeline:
         logger.info("=" * 60)
         
         try:
+            if validation_rules and self.backend != "pandas":
+                raise ValueError("validation_rules is only supported by the pandas backend")
+            
+            if self.backend == "dask":
+                return self._run_dask(
+                    export_format,
+                    remove_duplicates_flag=remove_duplicates_flag,
+                    missing_value_strategy=missing_value_strategy,
+                    standardize_columns=standardize_columns,
+                    date_columns=date_columns,
+                    remove_outliers_flag=remove_outliers_flag,
+                    outlier_columns=outlier_columns
+                )
+            if self.backend == "arrow":
+                return self._run_arrow(
+                    export_format,
+                    remove_duplicates_flag=remove_duplicates_flag,
+                    missing_value_strategy=missing_value_strategy,
+                    standardize_columns=standardize_columns,
+                    date_columns=date_columns,
+                    remove_outliers_flag=remove_outliers_flag,
+                    outlier_columns=outlier_columns
+                )
+            if self.backend == "chunked":
+                if remove_outliers_flag:
+                    raise ValueError("Outlier removal needs global bounds; use backend='dask' for it")
+                if export_format == "parquet":
+                    raise ValueError("The chunked backend exports CSV or JSON Lines only")
+                return self._run_chunked(
+                    export_format,
+                    remove_duplicates_flag=remove_duplicates_flag,
+                    missing_value_strategy=missing_value_strategy,
+                    standardize_columns=standardize_columns,
+                    date_columns=date_columns
+                )
+            
             # Step 1: Ingest data
             logger.info("Step 1: Data Ingestion")
-            self.raw_data = ingest_csv(self.input_path)
-            raw_info = get_data_info(self.raw_data)
+            self.raw_data = ingest_file(self.input_path)
+            raw_info = get_data_info(self.raw_data, deep_memory=False)
             
-            # Initialize cleaned data
-            self.cleaned_data = self.raw_data.copy()
+            # Copy-on-write (enabled in the package __init__) keeps raw_data
+            # unchanged while the cleaning steps below replace cleaned_data
+            self.cleaned_data = self.raw_data
             
             # Step 2: Clean data
             logger.info("Step 2: Data Cleaning")
             
+            logger.info("- Converting text columns to Arrow strings")
+            self.cleaned_data = convert_string_columns(self.cleaned_data)
+            
             if standardize_columns:
                 logger.info("- Standardizing column names")
                 self.cleaned_data = standardize_column_names(self.cleaned_data)
@@ -115,17 +172,15 @@ class DataCleaningPipeline:
                 logger.info("- Removing duplicates")
                 self.cleaned_data = remove_duplicates(self.cleaned_data)
             
-            logger.info("- Handling missing values")
+            logger.info("- Handling missing values and cleaning text columns")
             self.cleaned_data = handle_missing_values(
                 self.cleaned_data,
-                strategy=missing_value_strategy
+                strategy=missing_value_strategy,
+                clean_text=True
             )
             
-            logger.info("- Cleaning text columns")
-            self.cleaned_data = clean_text_columns(self.cleaned_data)
-            
             if date_columns:
-                logger.info(f"- Parsing date columns: {date_columns}")
+                logger.info("- Parsing date columns: %s", date_columns)
                 self.cleaned_data = parse_dates(self.cleaned_data, date_columns)
             
             if remove_outliers_flag:
@@ -135,8 +190,12 @@ class DataCleaningPipeline:
                     columns=outlier_columns
                 )
             
-            # Step 3: Generate quality report
-            logger.info("Step 3: Generating Quality Report")
+            # Step 3: Validate and generate quality report
+            logger.info("Step 3: Validation and Quality Report")
+            if validation_rules:
+                logger.info("- Running validations")
+                run_validations(self.cleaned_data, **validation_rules)
+            
             self.quality_report = generate_data_quality_report(self.cleaned_data)
             
             # Step 4: Export results
@@ -147,6 +206,8 @@ class DataCleaningPipeline:
                 export_to_csv(self.cleaned_data, output_path)
             elif export_format == "json":
                 export_to_json(self.cleaned_data, output_path.with_suffix('.json'))
+            elif export_format == "parquet":
+                export_to_parquet(self.cleaned_data, output_path.with_suffix('.parquet'))
             
             # Export quality report
             report_path = self.output_dir / "quality_report.json"
@@ -154,17 +215,109 @@ class DataCleaningPipeline:
             
             logger.info("=" * 60)
             logger.info("Pipeline completed successfully!")
-            logger.info(f"Input rows: {raw_info['rows']}, Output rows: {len(self.cleaned_data)}")
-            logger.info(f"Rows removed: {raw_info['rows'] - len(self.cleaned_data)}")
+            logger.info("Input rows: %s, Output rows: %s", raw_info['rows'], len(self.cleaned_data))
+            logger.info("Rows removed: %s", raw_info['rows'] - len(self.cleaned_data))
             logger.info("=" * 60)
             
             return self.cleaned_data
-            
+        
         except Exception as e:
             error_msg = f"Pipeline failed: {str(e)}"
             logger.error(error_msg)
             raise PipelineError(error_msg) from e
     
+    def _run_dask(self, export_format: str, **cleaning_options):
+        """
+        Run the pipeline on Dask partitions.
+        
+        The cleaned data stays a lazy Dask dataframe. The quality report
+        aggregations and the partitioned export run in one dask.compute
+        call, so the cleaning graph is evaluated once without loading the
+        data whole.
+        """
+        logger.info("Step 1: Data Ingestion (Dask)")
+        self.raw_data = ingest_dask(self.input_path)
+        
+        logger.info("Step 2: Data Cleaning (Dask)")
+        self.cleaned_data = clean_dask(self.raw_data, **cleaning_options)
+        
+        logger.info("Steps 3-4: Generating Quality Report and Exporting Results")
+        output_path, writes = export_dask_tasks(
+            self.cleaned_data, self.output_dir, Path(self.output_filename).stem, export_format
+        )
+        self.quality_report = dask_quality_report(self.cleaned_data, writes)
+        logger.info("Exported Dask partitions to %s", output_path)
+        export_summary_report(self.quality_report, self.output_dir / "quality_report.json")
+        
+        logger.info("=" * 60)
+        logger.info("Pipeline completed successfully!")
+        logger.info("Output rows: %s", self.quality_report['total_rows'])
+        logger.info("=" * 60)
+        
+        return self.cleaned_data
+    
+    def _run_arrow(self, export_format: str, **cleaning_options):
+        """
+        Run the pipeline on a pyarrow Table without converting to pandas.
+        
+        Cleaning, the quality report and CSV or Parquet export all use
+        Arrow's multithreaded compute kernels and writers.
+        """
+        logger.info("Step 1: Data Ingestion (Arrow)")
+        self.raw_data = ingest_arrow(self.input_path)
+        input_rows = self.raw_data.num_rows
+        
+        logger.info("Step 2: Data Cleaning (Arrow)")
+        self.cleaned_data = clean_arrow(self.raw_data, **cleaning_options)
+        
+        logger.info("Step 3: Generating Quality Report")
+        self.quality_report = generate_data_quality_report(self.cleaned_data)
+        
+        logger.info("Step 4: Exporting Results")
+        export_arrow(self.cleaned_data, self.output_dir / self.output_filename, export_format)
+        export_summary_report(self.quality_report, self.output_dir / "quality_report.json")
+        
+        logger.info("=" * 60)
+        logger.info("Pipeline completed successfully!")
+        logger.info("Input rows: %s, Output rows: %s", input_rows, self.cleaned_data.num_rows)
+        logger.info("=" * 60)
+        
+        return self.cleaned_data
+    
+    def _run_chunked(self, export_format: str, remove_duplicates_flag: bool = True, **cleaning_options):
+        """
+        Stream the input through the pipeline one chunk at a time.
+        
+        Only one chunk is held in memory: each is cleaned, folded into the
+        running quality report and appended to the output file. Duplicates
+        are removed across chunks by row hash. JSON output is JSON Lines.
+        The cleaned data is not kept, so cleaned_data stays None.
+        """
+        output_path = self.output_dir / self.output_filename
+        if export_format == "json":
+            output_path = output_path.with_suffix('.json')
+        
+        seen_rows = SeenRows() if remove_duplicates_flag else None
+        report = RunningQualityReport()
+        input_rows = 0
+        
+        logger.info("Steps 1-4: Streaming ingestion, cleaning, report and export")
+        for i, chunk in enumerate(ingest_chunks(self.input_path)):
+            input_rows += len(chunk)
+            chunk = clean_chunk(chunk, seen_rows, **cleaning_options)
+            report.update(chunk)
+            export_chunk(chunk, output_path, export_format, first=i == 0)
+        
+        self.quality_report = report.to_dict()
+        export_summary_report(self.quality_report, self.output_dir / "quality_report.json")
+        
+        logger.info("=" * 60)
+        logger.info("Pipeline completed successfully!")
+        logger.info("Input rows: %s, Output rows: %s", input_rows, self.quality_report['total_rows'])
+        logger.info("=" * 60)
+        
+        return self.cleaned_data
+    
     def get_cleaned_data(self) -> Optional[pd.DataFrame]:
         """Get the cleaned dataframe."""
         return self.cleaned_data
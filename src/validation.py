@@ -1,14 +1,75 @@
 """Data validation module to ensure data quality."""
 
-from typing import Dict, List, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Tuple, Union
 import pandas as pd
 import numpy as np
 
 from .exceptions import DataValidationError
 from .logger import setup_logger
 
+# Optional single-pass aggregation engine
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+# Optional columnar tables, reported on without converting to pandas
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+
+# Optional JIT compiler for the range-check kernel
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 logger = setup_logger(__name__)
 
+# Stats computed for numeric columns in the quality report
+NUMERIC_STATS = ("mean", "median", "std", "min", "max")
+
+# Ways to count range violations; 'auto' picks the fastest one installed
+RANGE_ENGINES = ("auto", "numba", "polars", "numpy")
+
+
+def _numeric_columns(df: pd.DataFrame) -> List[str]:
+    """Return the numeric (including boolean) columns, checked once per dtype."""
+    return [col for col, dtype in df.dtypes.items() if _dtype_matches(dtype, "numeric")]
+
+
+def _count_out_of_range_loop(values: np.ndarray, lo: float, hi: float) -> Tuple[int, int]:
+    """Count values below lo and above hi in a single pass, skipping NaN."""
+    below = 0
+    above = 0
+    for i in range(values.shape[0]):
+        v = values[i]
+        if v == v:
+            below += v < lo
+            above += v > hi
+    return below, above
+
+
+# Compiled, the loop makes one pass without temporary boolean arrays; it is
+# too slow to run uncompiled, so without Numba other paths are used instead
+_count_out_of_range = njit(cache=True)(_count_out_of_range_loop) if njit is not None else None
+
+
+def _to_lazy(df: pd.DataFrame) -> Optional["pl.LazyFrame"]:
+    """Convert a dataframe to a Polars LazyFrame, or None if Polars cannot take it."""
+    if pl is None:
+        return None
+    try:
+        return pl.from_pandas(df).lazy()
+    except Exception as e:
+        # e.g. non-string column names or mixed-type object columns
+        logger.debug("Falling back to pandas aggregations: %s", e)
+        return None
+
 
 def validate_schema(
     df: pd.DataFrame,
@@ -22,34 +83,75 @@ def validate_schema(
         df: Input dataframe
         expected_columns: List of expected column names
         strict: If True, dataframe must have exactly these columns
-        
+    
     Returns:
         True if validation passes
-        
+    
     Raises:
         DataValidationError: If validation fails
     """
-    actual_columns = set(df.columns)
-    expected_set = set(expected_columns)
-    
-    if strict:
-        if actual_columns != expected_set:
-            missing = expected_set - actual_columns
-            extra = actual_columns - expected_set
-            error_msg = f"Schema mismatch. Missing: {missing}, Extra: {extra}"
-            logger.error(error_msg)
-            raise DataValidationError(error_msg)
-    else:
-        missing = expected_set - actual_columns
-        if missing:
-            error_msg = f"Missing required columns: {missing}"
-            logger.error(error_msg)
-            raise DataValidationError(error_msg)
+    error_msg = _schema_error(df, expected_columns, strict)
+    if error_msg is not None:
+        logger.error(error_msg)
+        raise DataValidationError(error_msg)
     
     logger.info("Schema validation passed")
     return True
 
 
+def _schema_error(df: pd.DataFrame, expected_columns: List[str], strict: bool = False) -> Optional[str]:
+    """Describe how the columns differ from the expected ones, or None if they match."""
+    expected = pd.Index(expected_columns)
+    # Index.difference hashes against the columns Index and keeps the
+    # expected order, so the message lists columns deterministically
+    missing = expected.difference(df.columns, sort=False)
+    
+    if strict:
+        extra = df.columns.difference(expected, sort=False)
+        if len(missing) or len(extra):
+            return f"Schema mismatch. Missing: {list(missing)}, Extra: {list(extra)}"
+    elif len(missing):
+        return f"Missing required columns: {list(missing)}"
+    return None
+
+
+# Type names that match a family of dtypes rather than one exact dtype
+_CHECKERS = {
+    "numeric": pd.api.types.is_numeric_dtype,
+    "datetime": pd.api.types.is_datetime64_any_dtype,
+    "string": lambda dtype: pd.api.types.is_string_dtype(dtype) or pd.api.types.is_object_dtype(dtype)
+}
+
+
+@lru_cache(maxsize=None)
+def _target_dtype(expected_type: str) -> Optional[Any]:
+    """Resolve a type name to a pandas dtype, or None if it names no dtype."""
+    try:
+        return pd.api.types.pandas_dtype(expected_type)
+    except (TypeError, ValueError):
+        return None
+
+
+@lru_cache(maxsize=256)
+def _dtype_matches(dtype: Any, expected_type: str) -> bool:
+    """
+    Whether a dtype satisfies a type name.
+    
+    The answer depends only on the dtype, never on the data, so it is
+    memoized: frames validated repeatedly with the same dtypes skip the
+    pandas type introspection after the first call.
+    """
+    checker = _CHECKERS.get(expected_type)
+    if checker is not None:
+        return checker(dtype)
+    # Names that are not an exact dtype (e.g. 'int' for int32) still
+    # match as a substring of the dtype name
+    target = _target_dtype(expected_type)
+    if target is not None and dtype == target:
+        return True
+    return expected_type in str(dtype)
+
+
 def validate_data_types(
     df: pd.DataFrame,
     type_requirements: Dict[str, str]
@@ -60,49 +162,48 @@ def validate_data_types(
     Args:
         df: Input dataframe
         type_requirements: Dictionary mapping column names to expected types
-        
+    
     Returns:
         True if validation passes
-        
+    
     Raises:
         DataValidationError: If validation fails
     """
+    errors = _type_errors(df, type_requirements)
+    
+    if errors:
+        error = DataValidationError(check="Data type", errors=errors)
+        logger.error(str(error))
+        raise error
+    
+    logger.info("Data type validation passed")
+    return True
+
+
+def _type_errors(df: pd.DataFrame, type_requirements: Dict[str, str]) -> List[str]:
+    """List the columns that are missing or do not have their expected type."""
     errors = []
+    actual_dtypes = df.dtypes
+    # One snapshot of the labels makes each membership test a set lookup
+    present = frozenset(df.columns)
     
     for col, expected_type in type_requirements.items():
-        if col not in df.columns:
+        if col not in present:
             errors.append(f"Column '{col}' not found")
             continue
         
-        actual_type = str(df[col].dtype)
-        
-        # Flexible type checking
-        if expected_type == "numeric":
-            if not pd.api.types.is_numeric_dtype(df[col]):
-                errors.append(f"Column '{col}' should be numeric, got {actual_type}")
-        elif expected_type == "datetime":
-            if not pd.api.types.is_datetime64_any_dtype(df[col]):
-                errors.append(f"Column '{col}' should be datetime, got {actual_type}")
-        elif expected_type == "string":
-            if not pd.api.types.is_string_dtype(df[col]) and not pd.api.types.is_object_dtype(df[col]):
-                errors.append(f"Column '{col}' should be string, got {actual_type}")
-        else:
-            # Exact match for specific types
-            if expected_type not in actual_type:
-                errors.append(f"Column '{col}' should be {expected_type}, got {actual_type}")
-    
-    if errors:
-        error_msg = "Data type validation failed: " + "; ".join(errors)
-        logger.error(error_msg)
-        raise DataValidationError(error_msg)
+        actual_dtype = actual_dtypes[col]
+        if not _dtype_matches(actual_dtype, expected_type):
+            errors.append(f"Column '{col}' should be {expected_type}, got {actual_dtype}")
     
-    logger.info("Data type validation passed")
-    return True
+    return errors
 
 
 def validate_ranges(
     df: pd.DataFrame,
-    range_requirements: Dict[str, Dict[str, Any]]
+    range_requirements: Dict[str, Dict[str, Any]],
+    downcast: bool = False,
+    engine: str = "auto"
 ) -> bool:
     """
     Validate that numeric columns fall within expected ranges.
@@ -111,43 +212,170 @@ def validate_ranges(
         df: Input dataframe
         range_requirements: Dictionary mapping column names to range specs
             e.g., {'age': {'min': 0, 'max': 120}}
-        
+        downcast: Cast integer columns to the narrowest integer dtype before
+            comparing (off by default, as the cast is itself a pass over
+            each column)
+        engine: How to count violations: 'numba' (one compiled pass per
+            column), 'polars' (one query for all columns), 'numpy' (one
+            broadcast comparison), or 'auto' for the first one available
+    
     Returns:
         True if validation passes
-        
+    
     Raises:
         DataValidationError: If validation fails
     """
+    if engine not in RANGE_ENGINES:
+        raise ValueError(f"Unknown range engine '{engine}', expected one of {RANGE_ENGINES}")
+    
+    bounds, errors = _range_bounds(df, range_requirements)
+    
+    if downcast and bounds:
+        # Only integers: a float32 cast could round a value onto its bound
+        df = pd.DataFrame({
+            col: pd.to_numeric(df[col], downcast='integer') if pd.api.types.is_integer_dtype(df[col].dtype) else df[col]
+            for col in bounds
+        })
+    
+    errors.extend(_range_errors(bounds, _count_violations(df, bounds, engine)))
+    
+    if errors:
+        error = DataValidationError(check="Range", errors=errors)
+        logger.error(str(error))
+        raise error
+    
+    logger.info("Range validation passed")
+    return True
+
+
+def _range_bounds(
+    df: pd.DataFrame,
+    range_requirements: Dict[str, Dict[str, Any]]
+) -> Tuple[Dict[str, Tuple[Optional[float], Optional[float]]], List[str]]:
+    """Collect the (min, max) bounds of the checkable columns, and errors for the rest."""
     errors = []
+    bounds = {}
+    present = frozenset(df.columns)
+    numeric_cols = frozenset(_numeric_columns(df))
     
     for col, ranges in range_requirements.items():
-        if col not in df.columns:
+        if col not in present:
             errors.append(f"Column '{col}' not found")
             continue
         
-        if not pd.api.types.is_numeric_dtype(df[col]):
+        if col not in numeric_cols:
             errors.append(f"Column '{col}' is not numeric, cannot validate range")
             continue
         
-        if 'min' in ranges:
-            min_val = ranges['min']
-            violations = (df[col] < min_val).sum()
-            if violations > 0:
-                errors.append(f"Column '{col}' has {violations} values below minimum {min_val}")
-        
-        if 'max' in ranges:
-            max_val = ranges['max']
-            violations = (df[col] > max_val).sum()
-            if violations > 0:
-                errors.append(f"Column '{col}' has {violations} values above maximum {max_val}")
+        bounds[col] = (ranges.get('min'), ranges.get('max'))
     
-    if errors:
-        error_msg = "Range validation failed: " + "; ".join(errors)
-        logger.error(error_msg)
-        raise DataValidationError(error_msg)
+    return bounds, errors
+
+
+def _range_errors(
+    bounds: Dict[str, Tuple[Optional[float], Optional[float]]],
+    violations: Dict[str, Tuple[int, int]]
+) -> List[str]:
+    """Describe the columns with values below their minimum or above their maximum."""
+    errors = []
+    for col, (below, above) in violations.items():
+        min_val, max_val = bounds[col]
+        if below > 0:
+            errors.append(f"Column '{col}' has {below} values below minimum {min_val}")
+        if above > 0:
+            errors.append(f"Column '{col}' has {above} values above maximum {max_val}")
+    return errors
+
+
+def _count_violations(
+    df: pd.DataFrame,
+    bounds: Dict[str, Tuple[Optional[float], Optional[float]]],
+    engine: str = "auto"
+) -> Dict[str, Tuple[int, int]]:
+    """Count the values below and above each column's (min, max); None means unbounded."""
+    if engine == "numba" and _count_out_of_range is None:
+        raise ImportError("engine='numba' requires the numba package")
+    if engine == "polars" and pl is None:
+        raise ImportError("engine='polars' requires the polars package")
     
-    logger.info("Range validation passed")
-    return True
+    # The compiled and Polars paths take infinite bounds for unbounded sides
+    limits = {
+        col: (-np.inf if lo is None else lo, np.inf if hi is None else hi)
+        for col, (lo, hi) in bounds.items()
+    }
+    
+    if engine in ("auto", "numba") and _count_out_of_range is not None:
+        return {
+            col: _count_out_of_range(_float_values(df[col]), lo, hi)
+            for col, (lo, hi) in limits.items()
+        }
+    
+    # Without Numba, count every violation in one Polars query when possible
+    lf = _to_lazy(df[list(bounds)]) if bounds and engine in ("auto", "polars") else None
+    if lf is not None:
+        row = lf.select([
+            expr
+            for i, (col, (lo, hi)) in enumerate(limits.items())
+            for expr in ((pl.col(col) < lo).sum().alias(f"below_{i}"), (pl.col(col) > hi).sum().alias(f"above_{i}"))
+        ]).collect().row(0)
+        return {col: (row[2 * i], row[2 * i + 1]) for i, col in enumerate(bounds)}
+    
+    # Compare each column's own buffer against its bounds: int64 columns
+    # stay exact and are read without a float copy. NaN compares False on
+    # both sides, so missing values are never violations
+    violations = {}
+    with np.errstate(invalid='ignore'):
+        for col, (lo, hi) in bounds.items():
+            values = _float_values(df[col])
+            violations[col] = (
+                0 if lo is None else int(np.count_nonzero(values < lo)),
+                0 if hi is None else int(np.count_nonzero(values > hi))
+            )
+    return violations
+
+
+def _scan_columns(
+    df: pd.DataFrame,
+    bounds: Dict[str, Tuple[Optional[float], Optional[float]]],
+    columns: List[str]
+) -> Tuple[Dict[str, Tuple[int, int]], np.ndarray]:
+    """
+    Count range violations and nulls in one walk over the columns.
+    
+    Each column's buffer is read once for every check that applies to it:
+    a column that is both ranged and required gets its null count from the
+    same array its bounds are compared against.
+    """
+    violations = {}
+    null_counts = dict.fromkeys(columns, 0)
+    
+    # NaN compares False on both sides, so missing values are never violations
+    with np.errstate(invalid='ignore'):
+        for col in dict.fromkeys([*bounds, *columns]):
+            series = df[col]
+            if col not in bounds:
+                null_counts[col] = int(series.isna().sum())
+                continue
+            
+            values = _float_values(series)
+            lo, hi = bounds[col]
+            violations[col] = (
+                0 if lo is None else int(np.count_nonzero(values < lo)),
+                0 if hi is None else int(np.count_nonzero(values > hi))
+            )
+            if col in null_counts:
+                null_counts[col] = int(np.count_nonzero(np.isnan(values)))
+    
+    return violations, np.array([null_counts[col] for col in columns])
+
+
+def _float_values(series: pd.Series) -> np.ndarray:
+    """Return a column as a NumPy array, without copying plain int and float columns."""
+    dtype = series.dtype
+    if isinstance(dtype, np.dtype) and (np.issubdtype(dtype, np.integer) or np.issubdtype(dtype, np.floating)):
+        return series.to_numpy(copy=False)
+    # Nullable, boolean and extension dtypes: missing values become NaN
+    return series.to_numpy(dtype=float, na_value=np.nan)
 
 
 def validate_completeness(
@@ -162,78 +390,432 @@ def validate_completeness(
         df: Input dataframe
         required_columns: Columns that must meet completeness threshold
         completeness_threshold: Minimum fraction of non-null values (default: 0.95)
-        
+    
     Returns:
         True if validation passes
-        
+    
     Raises:
         DataValidationError: If validation fails
     """
-    errors = []
+    errors, columns = _required_columns(df, required_columns)
     
-    for col in required_columns:
-        if col not in df.columns:
-            errors.append(f"Required column '{col}' not found")
-            continue
-        
-        completeness = 1 - (df[col].isnull().sum() / len(df))
-        if completeness < completeness_threshold:
-            errors.append(
-                f"Column '{col}' completeness {completeness:.2%} "
-                f"below threshold {completeness_threshold:.2%}"
-            )
+    missing = df[columns].isna().to_numpy() if columns and df.shape[0] else None
+    # Usually nothing is missing, and any() stops at the first missing value
+    if missing is not None and missing.any():
+        # Completeness of every required column from the one null mask
+        errors.extend(_completeness_errors(columns, 1.0 - missing.mean(axis=0), completeness_threshold))
     
     if errors:
-        error_msg = "Completeness validation failed: " + "; ".join(errors)
-        logger.error(error_msg)
-        raise DataValidationError(error_msg)
+        error = DataValidationError(check="Completeness", errors=errors)
+        logger.error(str(error))
+        raise error
     
     logger.info("Completeness validation passed")
     return True
 
 
-def generate_data_quality_report(df: pd.DataFrame, subset: Optional[List[str]] = None) -> Dict[str, Any]:
+def _required_columns(df: pd.DataFrame, required_columns: List[str]) -> Tuple[List[str], List[str]]:
+    """Split required columns into errors for absent ones and the distinct present ones."""
+    present = frozenset(df.columns)
+    errors = [f"Required column '{col}' not found" for col in required_columns if col not in present]
+    columns = [col for col in dict.fromkeys(required_columns) if col in present]
+    return errors, columns
+
+
+def _completeness_errors(
+    columns: List[str],
+    completeness: np.ndarray,
+    completeness_threshold: float
+) -> List[str]:
+    """Describe the columns whose completeness falls below the threshold."""
+    violations = completeness < completeness_threshold
+    return [
+        f"Column '{col}' completeness {frac:.2%} below threshold {completeness_threshold:.2%}"
+        for col, frac in zip(np.asarray(columns, dtype=object)[violations], completeness[violations])
+    ]
+
+
+def run_validations(
+    df: pd.DataFrame,
+    schema: Optional[List[str]] = None,
+    types: Optional[Dict[str, str]] = None,
+    ranges: Optional[Dict[str, Dict[str, Any]]] = None,
+    completeness: Optional[List[str]] = None,
+    completeness_threshold: float = 0.95
+) -> bool:
+    """
+    Run the requested validations concurrently.
+    
+    The checks only read the dataframe and spend most of their time in
+    pandas and NumPy code that releases the GIL, so they run on a thread pool.
+    
+    Args:
+        df: Input dataframe
+        schema: Expected column names (see validate_schema)
+        types: Expected column types (see validate_data_types)
+        ranges: Expected column ranges (see validate_ranges)
+        completeness: Columns that must meet the completeness threshold
+        completeness_threshold: Minimum fraction of non-null values
+    
+    Returns:
+        True if all validations pass
+    
+    Raises:
+        DataValidationError: The first failing validation, in argument order
+    """
+    checks = []
+    if schema is not None:
+        checks.append((validate_schema, (schema,)))
+    if types is not None:
+        checks.append((validate_data_types, (types,)))
+    if ranges is not None:
+        checks.append((validate_ranges, (ranges,)))
+    if completeness is not None:
+        checks.append((validate_completeness, (completeness, completeness_threshold)))
+    
+    with ThreadPoolExecutor(max_workers=max(len(checks), 1)) as executor:
+        futures = [executor.submit(check, df, *args) for check, args in checks]
+    
+    for future in futures:
+        future.result()
+    
+    return True
+
+
+def validate_all(
+    df: pd.DataFrame,
+    schema: Optional[List[str]] = None,
+    types: Optional[Dict[str, str]] = None,
+    ranges: Optional[Dict[str, Dict[str, Any]]] = None,
+    completeness: Optional[List[str]] = None,
+    completeness_threshold: float = 0.95
+) -> bool:
     """
-    Generate a comprehensive data quality report.
+    Run the requested validations as one check and report every failure.
+    
+    Schema and type checks only read column metadata. The range and
+    completeness checks share one scan of the data: a single Polars query
+    when Polars is installed.
     
     Args:
         df: Input dataframe
+        schema: Expected column names (see validate_schema)
+        types: Expected column types (see validate_data_types)
+        ranges: Expected column ranges (see validate_ranges)
+        completeness: Columns that must meet the completeness threshold
+        completeness_threshold: Minimum fraction of non-null values
+    
+    Returns:
+        True if all validations pass
+    
+    Raises:
+        DataValidationError: Listing the failures of every check
+    """
+    errors = []
+    if schema is not None:
+        schema_error = _schema_error(df, schema)
+        if schema_error is not None:
+            errors.append(schema_error)
+    if types is not None:
+        errors.extend(_type_errors(df, types))
+    
+    bounds, range_errors = _range_bounds(df, ranges or {})
+    errors.extend(range_errors)
+    required_errors, columns = _required_columns(df, completeness or [])
+    errors.extend(required_errors)
+    
+    violations, null_counts = _scan_counts(df, bounds, columns)
+    errors.extend(_range_errors(bounds, violations))
+    nrows = df.shape[0]
+    if columns and nrows:
+        errors.extend(_completeness_errors(columns, 1.0 - null_counts / nrows, completeness_threshold))
+    
+    if errors:
+        error = DataValidationError(check="Data", errors=errors)
+        logger.error(str(error))
+        raise error
+    
+    logger.info("All validations passed")
+    return True
+
+
+def _scan_counts(
+    df: pd.DataFrame,
+    bounds: Dict[str, Tuple[Optional[float], Optional[float]]],
+    columns: List[str]
+) -> Tuple[Dict[str, Tuple[int, int]], np.ndarray]:
+    """Count range violations for the bounded columns and nulls for the given columns."""
+    lf = _to_lazy(df[list(dict.fromkeys([*bounds, *columns]))]) if bounds or columns else None
+    if lf is None:
+        return _scan_columns(df, bounds, columns)
+    
+    # Aliases are positional so that any column name is safe
+    exprs = []
+    for i, (col, (lo, hi)) in enumerate(bounds.items()):
+        if lo is not None:
+            exprs.append((pl.col(col) < lo).sum().alias(f"below_{i}"))
+        if hi is not None:
+            exprs.append((pl.col(col) > hi).sum().alias(f"above_{i}"))
+    exprs.extend(pl.col(col).null_count().alias(f"null_{i}") for i, col in enumerate(columns))
+    row = lf.select(exprs).collect().row(0, named=True) if exprs else {}
+    
+    violations = {
+        col: (row.get(f"below_{i}", 0), row.get(f"above_{i}", 0))
+        for i, col in enumerate(bounds)
+    }
+    return violations, np.array([row[f"null_{i}"] for i in range(len(columns))])
+
+
+def generate_data_quality_report(
+    df: Union[pd.DataFrame, "pa.Table"],
+    subset: Optional[List[str]] = None,
+    include_duplicate_count: bool = True
+) -> Dict[str, Any]:
+    """
+    Generate a comprehensive data quality report.
+    
+    Args:
+        df: Input dataframe or Arrow Table
         subset: Column subset to use for duplicate detection (default: all columns)
-        
+        include_duplicate_count: Whether to count duplicate rows; if False,
+            'duplicate_rows' is None and only 'has_duplicates' is reported,
+            which the pandas path answers without collecting unique rows
+    
     Returns:
         Dictionary containing quality metrics
     """
+    if pa is not None and isinstance(df, pa.Table):
+        report = _quality_report_arrow(df, subset, include_duplicate_count)
+        logger.info("Generated data quality report: %s rows, %s missing values (%.2f%%)",
+                    report['total_rows'], report['total_missing_values'], report['missing_percentage'])
+        return report
+    
+    lf = _to_lazy(df)
+    if lf is not None:
+        report = _quality_report_polars(df, lf, subset, include_duplicate_count)
+        logger.info("Generated data quality report: %s rows, %s missing values (%.2f%%)",
+                    report['total_rows'], report['total_missing_values'], report['missing_percentage'])
+        return report
+    
+    nrows, ncols = df.shape
+    # Each statistic is computed for all columns at once; the loop below
+    # only copies scalars out of these precomputed results
+    # count() reduces block by block instead of materializing an isnull() frame
+    null_counts = nrows - df.count()
+    nuniques = {col: _nunique(series) for col, series in df.items()}
+    numeric_cols = _numeric_columns(df)
+    # All-missing columns have no stats, so they are left out of the aggregation
+    has_values = [col for col in numeric_cols if null_counts[col] < nrows]
+    numeric_stats = df[has_values].astype(float).agg(list(NUMERIC_STATS)) if has_values else pd.DataFrame()
+    all_missing_numeric = set(numeric_cols).difference(has_values)
+    
+    total_missing = int(null_counts.sum())
+    has_duplicates, duplicate_rows = _duplicate_rows(df, subset, include_duplicate_count)
     report = {
-        "total_rows": len(df),
-        "total_columns": len(df.columns),
-        "duplicate_rows": df.duplicated(subset=subset).sum(),
-        "columns_with_missing": (df.isnull().any()).sum(),
-        "total_missing_values": df.isnull().sum().sum(),
-        "missing_percentage": (df.isnull().sum().sum() / (len(df) * len(df.columns))) * 100,
+        "total_rows": nrows,
+        "total_columns": ncols,
+        "duplicate_rows": duplicate_rows,
+        "has_duplicates": has_duplicates,
+        "columns_with_missing": int((null_counts > 0).sum()),
+        "total_missing_values": total_missing,
+        "missing_percentage": total_missing / (nrows * ncols) * 100 if nrows and ncols else 0.0,
         "column_stats": {}
     }
     
+    dtypes = df.dtypes
     for col in df.columns:
         stats = {
-            "dtype": str(df[col].dtype),
-            "missing_count": int(df[col].isnull().sum()),
-            "missing_percentage": float((df[col].isnull().sum() / len(df)) * 100),
-            "unique_values": int(df[col].nunique())
+            "dtype": str(dtypes[col]),
+            "missing_count": int(null_counts[col]),
+            "missing_percentage": float((null_counts[col] / nrows) * 100),
+            "unique_values": nuniques[col]
         }
         
-        if pd.api.types.is_numeric_dtype(df[col]):
-            stats.update({
-                "mean": float(df[col].mean()) if not df[col].isnull().all() else None,
-                "median": float(df[col].median()) if not df[col].isnull().all() else None,
-                "std": float(df[col].std()) if not df[col].isnull().all() else None,
-                "min": float(df[col].min()) if not df[col].isnull().all() else None,
-                "max": float(df[col].max()) if not df[col].isnull().all() else None,
-            })
+        if col in numeric_stats.columns:
+            stats.update({stat: float(numeric_stats.at[stat, col]) for stat in NUMERIC_STATS})
+        elif col in all_missing_numeric:
+            stats.update(dict.fromkeys(NUMERIC_STATS))
         
         report["column_stats"][col] = stats
     
-    logger.info(f"Generated data quality report: {report['total_rows']} rows, "
-                f"{report['total_missing_values']} missing values "
-                f"({report['missing_percentage']:.2f}%)")
+    logger.info("Generated data quality report: %s rows, %s missing values (%.2f%%)",
+                report['total_rows'], report['total_missing_values'], report['missing_percentage'])
+    
+    return report
+
+
+def _nunique(series: pd.Series) -> int:
+    """Count distinct non-null values; categorical columns count the codes in use without hashing."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes = series.cat.codes.to_numpy()
+        return int(np.count_nonzero(np.bincount(codes[codes >= 0], minlength=len(series.cat.categories))))
+    return int(series.nunique(dropna=True))
+
+
+def _has_object_columns(df: pd.DataFrame) -> bool:
+    """Whether any column holds Python objects, whose hashes can disagree with ==."""
+    return any(pd.api.types.is_object_dtype(dtype) for dtype in df.dtypes)
+
+
+def _duplicate_rows(
+    df: pd.DataFrame,
+    subset: Optional[List[str]] = None,
+    include_count: bool = True
+) -> Tuple[bool, Optional[int]]:
+    """
+    Whether any row repeats an earlier row and, if requested, how many do.
+    
+    Typed columns are compared by row hash. Object columns go through
+    df.duplicated(), as in remove_duplicates: it treats 1, 1.0 and True as
+    equal where their hashes differ, and it handles unhashable values such
+    as lists.
+    """
+    rows = df if subset is None else df[subset]
+    if _has_object_columns(rows):
+        count = int(df.duplicated(subset=subset).sum())
+        return count > 0, count if include_count else None
+    hashes = pd.util.hash_pandas_object(rows, index=False).to_numpy()
+    
+    if not include_count:
+        # The uniqueness check only builds the hash table, without
+        # collecting the unique values
+        return not pd.Index(hashes).is_unique, None
+    count = len(hashes) - len(pd.unique(hashes))
+    return count > 0, count
+
+
+def _quality_report_polars(
+    df: pd.DataFrame,
+    lf: "pl.LazyFrame",
+    subset: Optional[List[str]] = None,
+    include_duplicate_count: bool = True
+) -> Dict[str, Any]:
+    """
+    Compute the quality report with one fused Polars query.
+    
+    Args:
+        df: Input dataframe, used for its pandas dtypes
+        lf: The same data as a Polars LazyFrame
+        subset: Column subset to use for duplicate detection (default: all columns)
+        include_duplicate_count: Whether to report the duplicate row count
+    
+    Returns:
+        Dictionary with the same structure as the pandas report
+    """
+    columns = list(df.columns)
+    numeric_cols = _numeric_columns(df)
+    
+    # Aliases are positional so that any column name is safe
+    # Object columns are left to _duplicate_rows, which matches df.duplicated()
+    count_distinct = not _has_object_columns(df if subset is None else df[subset])
+    exprs = [pl.len().alias("rows")]
+    if count_distinct:
+        exprs.append(pl.struct(subset or columns).n_unique().alias("distinct"))
+    for i, col in enumerate(columns):
+        exprs.append(pl.col(col).null_count().alias(f"null_{i}"))
+        exprs.append(pl.col(col).drop_nulls().n_unique().alias(f"nunique_{i}"))
+    for i, col in enumerate(numeric_cols):
+        values = pl.col(col).cast(pl.Float64)
+        exprs.extend([
+            values.mean().alias(f"mean_{i}"),
+            values.median().alias(f"median_{i}"),
+            values.std().alias(f"std_{i}"),
+            values.min().alias(f"min_{i}"),
+            values.max().alias(f"max_{i}")
+        ])
+    
+    row = lf.select(exprs).collect().row(0, named=True)
+    
+    nrows = row["rows"]
+    ncols = len(columns)
+    null_counts = [row[f"null_{i}"] for i in range(ncols)]
+    total_missing = sum(null_counts)
+    
+    if count_distinct:
+        duplicate_rows = nrows - row["distinct"]
+        has_duplicates = duplicate_rows > 0
+        if not include_duplicate_count:
+            duplicate_rows = None
+    else:
+        has_duplicates, duplicate_rows = _duplicate_rows(df, subset, include_duplicate_count)
+    
+    report = {
+        "total_rows": nrows,
+        "total_columns": ncols,
+        "duplicate_rows": duplicate_rows,
+        "has_duplicates": has_duplicates,
+        "columns_with_missing": sum(1 for count in null_counts if count > 0),
+        "total_missing_values": total_missing,
+        "missing_percentage": total_missing / (nrows * ncols) * 100 if nrows and ncols else 0.0,
+        "column_stats": {}
+    }
+    
+    dtypes = df.dtypes
+    for i, col in enumerate(columns):
+        report["column_stats"][col] = {
+            "dtype": str(dtypes[col]),
+            "missing_count": null_counts[i],
+            "missing_percentage": null_counts[i] / nrows * 100 if nrows else 0.0,
+            "unique_values": row[f"nunique_{i}"]
+        }
+    for i, col in enumerate(numeric_cols):
+        report["column_stats"][col].update({stat: row[f"{stat}_{i}"] for stat in NUMERIC_STATS})
+    
+    return report
+
+
+def _quality_report_arrow(
+    table: "pa.Table",
+    subset: Optional[List[str]] = None,
+    include_duplicate_count: bool = True
+) -> Dict[str, Any]:
+    """
+    Compute the quality report with Arrow compute kernels.
+    
+    Args:
+        table: Input Arrow Table
+        subset: Column subset to use for duplicate detection (default: all columns)
+        include_duplicate_count: Whether to report the duplicate row count
+    
+    Returns:
+        Dictionary with the same structure as the pandas report
+    """
+    nrows, ncols = table.num_rows, table.num_columns
+    distinct_rows = table.group_by(subset or table.column_names).aggregate([]).num_rows
+    null_counts = [column.null_count for column in table.columns]
+    total_missing = sum(null_counts)
+    
+    report = {
+        "total_rows": nrows,
+        "total_columns": ncols,
+        "duplicate_rows": nrows - distinct_rows if include_duplicate_count else None,
+        "has_duplicates": distinct_rows < nrows,
+        "columns_with_missing": sum(1 for count in null_counts if count > 0),
+        "total_missing_values": total_missing,
+        "missing_percentage": total_missing / (nrows * ncols) * 100 if nrows and ncols else 0.0,
+        "column_stats": {}
+    }
+    
+    for field, column, null_count in zip(table.schema, table.columns, null_counts):
+        if pa.types.is_dictionary(field.type):
+            # Compute kernels such as count_distinct take the decoded values
+            column = column.cast(field.type.value_type)
+        stats = {
+            "dtype": str(field.type),
+            "missing_count": null_count,
+            "missing_percentage": null_count / nrows * 100 if nrows else 0.0,
+            "unique_values": pc.count_distinct(column, mode="only_valid").as_py()
+        }
+        if pa.types.is_integer(field.type) or pa.types.is_floating(field.type) or pa.types.is_boolean(field.type):
+            values = column.cast(pa.float64())
+            min_max = pc.min_max(values)
+            stats.update({
+                "mean": pc.mean(values).as_py(),
+                "median": pc.quantile(values, q=0.5)[0].as_py(),
+                "std": pc.stddev(values, ddof=1).as_py(),
+                "min": min_max["min"].as_py(),
+                "max": min_max["max"].as_py()
+            })
+        report["column_stats"][field.name] = stats
     
     return report
@@ -1,5 +1,6 @@
 """Unit tests for data cleaning module."""
 
+import importlib.util
 import unittest
 import pandas as pd
 import numpy as np
@@ -8,7 +9,9 @@ from src.cleaning import (
     remove_duplicates,
     handle_missing_values,
     standardize_column_names,
+    convert_string_columns,
     clean_text_columns,
+    parse_dates,
     remove_outliers
 )
 
@@ -28,6 +31,23 @@ class TestDataCleaning(unittest.TestCase):
         self.assertEqual(len(result), 3)
         self.assertEqual(list(result['id']), [1, 2, 3])
     
+    def test_remove_duplicates_wide_frame(self):
+        """Test duplicate removal on a frame wide enough for the prefilter."""
+        df = pd.DataFrame({
+            'id': [1, 2, 2, 3, 2],
+            'a': ['x', 'y', 'y', 'z', 'y'],
+            'b': ['p', 'q', 'q', 'r', 'other'],
+            'c': [1.0, 2.0, 2.0, 3.0, 2.0]
+        })
+        
+        result = remove_duplicates(df)
+        
+        self.assertEqual(list(result.index), [0, 1, 3, 4])
+        pd.testing.assert_frame_equal(result, df.drop_duplicates())
+        
+        result_last = remove_duplicates(df, keep='last')
+        pd.testing.assert_frame_equal(result_last, df.drop_duplicates(keep='last'))
+    
     def test_handle_missing_values_auto(self):
         """Test automatic missing value handling."""
         df = pd.DataFrame({
@@ -40,6 +60,18 @@ class TestDataCleaning(unittest.TestCase):
         # Should have no missing values
         self.assertEqual(result.isnull().sum().sum(), 0)
     
+    def test_handle_missing_values_auto_median_for_all_numeric_dtypes(self):
+        """Test median imputation covers numeric dtypes beyond int64/float64."""
+        df = pd.DataFrame({
+            'small': np.array([1.0, np.nan, 3.0, 100.0], dtype='float32'),
+            'nullable': pd.array([1, None, 4, 100], dtype='Int64')
+        })
+        
+        result = handle_missing_values(df, strategy='auto')
+        
+        self.assertEqual(result['small'].iloc[1], 3.0)
+        self.assertEqual(result['nullable'].iloc[1], 4)
+    
     def test_handle_missing_values_drop_rows(self):
         """Test dropping rows with missing values."""
         df = pd.DataFrame({
@@ -77,6 +109,104 @@ class TestDataCleaning(unittest.TestCase):
         self.assertEqual(result['name'].iloc[0], 'Alice')
         self.assertEqual(result['city'].iloc[1], 'LA')
     
+    @unittest.skipUnless(importlib.util.find_spec("pyarrow"), "pyarrow not installed")
+    def test_convert_string_columns(self):
+        """Test text columns become Arrow strings and mixed columns are kept."""
+        df = pd.DataFrame({
+            'name': ['  Alice  ', np.nan],
+            'mixed': ['a', 1],
+            'age': [25, 30]
+        })
+        
+        result = convert_string_columns(df)
+        
+        self.assertEqual(result['name'].dtype, 'string[pyarrow]')
+        self.assertEqual(result['mixed'].dtype, object)
+        self.assertEqual(clean_text_columns(result)['name'].iloc[0], 'Alice')
+    
+    def test_clean_text_columns_does_not_mutate_input(self):
+        """Test text cleaning leaves the input intact and shares untouched columns."""
+        df = pd.DataFrame({
+            'name': ['  Alice  ', 'Bob'],
+            'age': [25, 30]
+        })
+        
+        result = clean_text_columns(df)
+        
+        self.assertEqual(df['name'].iloc[0], '  Alice  ')
+        self.assertTrue(np.shares_memory(df['age'].to_numpy(), result['age'].to_numpy()))
+    
+    def test_clean_text_columns_skips_clean_columns(self):
+        """Test already-clean text columns are passed through without a copy."""
+        df = pd.DataFrame({
+            'name': ['Alice', 'Bob', np.nan],
+            'city': ['LA', 'NYC\u00a0', 'Chicago']
+        })
+        
+        result = clean_text_columns(df)
+        
+        self.assertTrue(np.shares_memory(df['name'].to_numpy(), result['name'].to_numpy()))
+        self.assertEqual(result['city'].iloc[1], 'NYC')
+    
+    def test_clean_text_columns_categorical(self):
+        """Test text cleaning merges categories that differ only by whitespace."""
+        df = pd.DataFrame({
+            'city': pd.Categorical(['LA', '  LA  ', 'Chicago', np.nan])
+        })
+        
+        result = clean_text_columns(df)
+        
+        self.assertIsInstance(result['city'].dtype, pd.CategoricalDtype)
+        self.assertEqual(sorted(result['city'].cat.categories), ['Chicago', 'LA'])
+        self.assertTrue(result['city'].isna().iloc[3])
+    
+    def test_handle_missing_values_fill_categorical(self):
+        """Test filling a categorical column with a new category."""
+        df = pd.DataFrame({
+            'status': pd.Categorical(['active', np.nan, 'pending'])
+        })
+        
+        result = handle_missing_values(df, strategy='fill', fill_value='Unknown')
+        
+        self.assertEqual(result['status'].iloc[1], 'Unknown')
+        self.assertIsInstance(result['status'].dtype, pd.CategoricalDtype)
+    
+    def test_handle_missing_values_clean_text_matches_separate_steps(self):
+        """Test the fused fill-and-strip matches filling then cleaning text."""
+        df = pd.DataFrame({
+            'name': [' Alice ', None, 'Bob', 'Bob '],
+            'city': pd.Categorical(['LA', ' LA', np.nan, 'NYC']),
+            'age': [25.0, np.nan, 35.0, 40.0]
+        })
+        
+        expected = clean_text_columns(handle_missing_values(df, strategy='auto'))
+        result = handle_missing_values(df, strategy='auto', clean_text=True)
+        
+        pd.testing.assert_frame_equal(result, expected)
+    
+    def test_parse_dates_single_format(self):
+        """Test date parsing detects a non-default format."""
+        df = pd.DataFrame({
+            'date': ['25/12/2021', '01/02/2022', None]
+        })
+        
+        result = parse_dates(df, ['date'])
+        
+        self.assertEqual(result['date'].iloc[0], pd.Timestamp('2021-12-25'))
+        self.assertEqual(result['date'].iloc[1], pd.Timestamp('2022-02-01'))
+        self.assertTrue(pd.isna(result['date'].iloc[2]))
+    
+    def test_parse_dates_mixed_formats(self):
+        """Test date parsing of a column mixing several formats."""
+        df = pd.DataFrame({
+            'date': ['2021-12-25', '12-26-2021']
+        })
+        
+        result = parse_dates(df, ['date'])
+        
+        self.assertTrue(pd.api.types.is_datetime64_any_dtype(result['date']))
+        self.assertEqual(result['date'].iloc[1], pd.Timestamp('2021-12-26'))
+    
     def test_remove_outliers_iqr(self):
         """Test outlier removal using IQR method."""
         df = pd.DataFrame({
@@ -88,6 +218,17 @@ class TestDataCleaning(unittest.TestCase):
         self.assertLess(len(result), len(df))
         self.assertNotIn(100, result['value'].values)
 
+    def test_remove_outliers_zscore_multiple_columns(self):
+        """Test Z-score outlier removal across several columns."""
+        df = pd.DataFrame({
+            'a': [1.0, 2.0, 3.0, 2.0, 1.0, 2.0, 3.0, 2.0, 1.0, 50.0],
+            'b': [10, 11, 12, 11, 10, 500, 12, 11, 10, 11]
+        })
+        
+        result = remove_outliers(df, method='zscore', threshold=2)
+        
+        self.assertEqual(list(result.index), [0, 1, 2, 3, 4, 6, 7, 8])
+
 
 if __name__ == '__main__':
     unittest.main()
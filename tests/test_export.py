@@ -1,12 +1,17 @@
 """Unit tests for data export module."""
 
+import importlib.util
 import unittest
 import pandas as pd
 import tempfile
 import json
+from datetime import date
 from pathlib import Path
+from unittest import mock
 
-from src.export import export_to_csv, export_to_json, export_summary_report
+import numpy as np
+
+from src.export import export_to_csv, export_to_json, export_to_parquet, export_summary_report
 from src.exceptions import DataExportError
 
 
@@ -35,6 +40,35 @@ class TestDataExport(unittest.TestCase):
         df = pd.read_csv(output_path)
         pd.testing.assert_frame_equal(df, self.test_data)
     
+    def test_export_to_csv_default_matches_pandas(self):
+        """Test the default CSV output is byte for byte what df.to_csv writes."""
+        df = self.test_data.assign(when=pd.to_datetime('2021-10-13'))
+        output_path = Path(self.temp_dir) / "output.csv"
+        
+        export_to_csv(df, output_path)
+        self.assertEqual(output_path.read_bytes(), df.to_csv(index=False).encode())
+        
+        export_to_csv(df, output_path, index=True)
+        self.assertEqual(output_path.read_bytes(), df.to_csv(index=True).encode())
+    
+    def test_export_to_csv_engines(self):
+        """Test every CSV engine writes the same data."""
+        engines = ["pandas"] + [engine for engine in ("pyarrow", "polars") if importlib.util.find_spec(engine)]
+        for engine in engines:
+            with self.subTest(engine=engine):
+                output_path = Path(self.temp_dir) / f"output_{engine}.csv"
+                export_to_csv(self.test_data, output_path, engine=engine)
+                
+                df = pd.read_csv(output_path)
+                pd.testing.assert_frame_equal(df, self.test_data)
+    
+    def test_export_to_csv_unknown_engine(self):
+        """Test CSV export with an unknown engine."""
+        output_path = Path(self.temp_dir) / "output.csv"
+        
+        with self.assertRaises(DataExportError):
+            export_to_csv(self.test_data, output_path, engine="unknown")
+    
     def test_export_to_json_success(self):
         """Test successful JSON export."""
         output_path = Path(self.temp_dir) / "output.json"
@@ -48,6 +82,25 @@ class TestDataExport(unittest.TestCase):
         df = pd.read_json(output_path)
         pd.testing.assert_frame_equal(df, self.test_data)
     
+    def test_export_to_json_lines_chunked(self):
+        """Test JSON Lines export written in several chunks."""
+        output_path = Path(self.temp_dir) / "output.jsonl"
+        
+        export_to_json(self.test_data, output_path, lines=True, chunksize=2)
+        
+        df = pd.read_json(output_path, lines=True)
+        pd.testing.assert_frame_equal(df, self.test_data)
+    
+    @unittest.skipUnless(importlib.util.find_spec("pyarrow"), "pyarrow not installed")
+    def test_export_to_parquet_success(self):
+        """Test successful Parquet export."""
+        output_path = Path(self.temp_dir) / "output.parquet"
+        
+        result_path = export_to_parquet(self.test_data, output_path)
+        
+        self.assertEqual(result_path, output_path)
+        pd.testing.assert_frame_equal(pd.read_parquet(output_path), self.test_data)
+    
     def test_export_summary_report(self):
         """Test summary report export."""
         output_path = Path(self.temp_dir) / "report.json"
@@ -67,6 +120,28 @@ class TestDataExport(unittest.TestCase):
             loaded_report = json.load(f)
         
         self.assertEqual(loaded_report, test_report)
+    
+    def test_export_summary_report_without_orjson(self):
+        """Test that the standard json writer matches orjson on NumPy values and NaN."""
+        test_report = {
+            'total_rows': np.int64(5),
+            'has_duplicates': np.bool_(False),
+            'column_stats': {'value': {'mean': np.float64(2.5), 'std': np.nan, 'when': pd.Timestamp('2024-01-01'), 'day': date(2024, 1, 2)}}
+        }
+        expected = {
+            'total_rows': 5,
+            'has_duplicates': False,
+            'column_stats': {'value': {'mean': 2.5, 'std': None, 'when': '2024-01-01 00:00:00', 'day': '2024-01-02'}}
+        }
+        
+        output_path = Path(self.temp_dir) / "report.json"
+        with mock.patch("src.export.orjson", None):
+            export_summary_report(test_report, output_path)
+        self.assertEqual(json.loads(output_path.read_text()), expected)
+        
+        if importlib.util.find_spec("orjson"):
+            orjson_path = export_summary_report(test_report, Path(self.temp_dir) / "report_orjson.json")
+            self.assertEqual(json.loads(orjson_path.read_text()), expected)
 
 
 if __name__ == '__main__':
@@ -1,11 +1,13 @@
 """Unit tests for data ingestion module."""
 
+import datetime
+import importlib.util
 import unittest
 import pandas as pd
 import tempfile
 from pathlib import Path
 
-from src.ingestion import ingest_csv, get_data_info
+from src.ingestion import ingest_csv, ingest_file, get_data_info
 from src.exceptions import DataIngestionError
 
 
@@ -35,6 +37,35 @@ class TestDataIngestion(unittest.TestCase):
         self.assertEqual(list(df.columns), ['id', 'name', 'age'])
         pd.testing.assert_frame_equal(df, self.test_data)
     
+    def test_ingest_csv_columns_and_schema(self):
+        """Test CSV ingestion of selected columns with declared dtypes."""
+        csv_path = Path(self.temp_dir) / "test.csv"
+        self.test_data.to_csv(csv_path, index=False)
+        
+        df = ingest_csv(csv_path, columns=['id', 'name'], schema={'id': 'int32', 'name': 'string'})
+        
+        self.assertEqual(list(df.columns), ['id', 'name'])
+        self.assertEqual(df['id'].dtype, 'int32')
+        self.assertEqual(df['name'].dtype, 'string')
+    
+    @unittest.skipUnless(importlib.util.find_spec("pyarrow"), "pyarrow not installed")
+    def test_ingest_csv_pyarrow_backend_is_opt_in(self):
+        """Test that only backend='pyarrow' changes the inferred dtypes."""
+        csv_path = Path(self.temp_dir) / "test.csv"
+        self.test_data.assign(joined=['2021-10-13', '2022-01-05', '2023-07-30']).to_csv(csv_path, index=False)
+        
+        df = ingest_csv(csv_path)
+        arrow_df = ingest_csv(csv_path, backend="pyarrow")
+        
+        pd.testing.assert_series_equal(df.dtypes, pd.read_csv(csv_path).dtypes)
+        self.assertIsInstance(df['joined'][0], str)
+        # Arrow parses ISO dates as date32, which pandas receives as datetime.date
+        self.assertIsInstance(arrow_df['joined'][0], datetime.date)
+        
+        typed = ingest_csv(csv_path, columns=['id', 'name'], schema={'id': 'int32', 'name': 'string'}, backend="pyarrow")
+        self.assertEqual(typed['id'].dtype, 'int32')
+        self.assertEqual(typed['name'].dtype, 'string')
+    
     def test_ingest_csv_file_not_found(self):
         """Test ingestion with non-existent file."""
         non_existent_path = Path(self.temp_dir) / "nonexistent.csv"
@@ -42,6 +73,30 @@ class TestDataIngestion(unittest.TestCase):
         with self.assertRaises(DataIngestionError):
             ingest_csv(non_existent_path)
     
+    @unittest.skipUnless(importlib.util.find_spec("pyarrow"), "pyarrow not installed")
+    def test_ingest_file_parquet(self):
+        """Test Parquet ingestion dispatched by file suffix."""
+        parquet_path = Path(self.temp_dir) / "test.parquet"
+        self.test_data.to_parquet(parquet_path, index=False)
+        
+        df = ingest_file(parquet_path)
+        
+        pd.testing.assert_frame_equal(df, self.test_data)
+    
+    @unittest.skipUnless(importlib.util.find_spec("pyarrow"), "pyarrow not installed")
+    def test_ingest_csv_arrow_backend(self):
+        """Test CSV ingestion into an Arrow Table and its data info."""
+        csv_path = Path(self.temp_dir) / "test.csv"
+        self.test_data.to_csv(csv_path, index=False)
+        
+        table = ingest_csv(csv_path, backend="arrow")
+        info = get_data_info(table)
+        
+        self.assertEqual(table.num_rows, 3)
+        self.assertEqual(info['columns'], 3)
+        self.assertEqual(info['column_names'], ['id', 'name', 'age'])
+        self.assertEqual(info['missing_values'], {'id': 0, 'name': 0, 'age': 0})
+    
     def test_get_data_info(self):
         """Test data info extraction."""
         info = get_data_info(self.test_data)
@@ -51,6 +106,13 @@ class TestDataIngestion(unittest.TestCase):
         self.assertEqual(info['column_names'], ['id', 'name', 'age'])
         self.assertIn('id', info['dtypes'])
         self.assertIn('missing_values', info)
+    
+    def test_get_data_info_deep_memory(self):
+        """Test that deep memory usage includes string contents."""
+        shallow = get_data_info(self.test_data)
+        deep = get_data_info(self.test_data, deep_memory=True)
+        
+        self.assertGreater(deep['memory_usage_mb'], shallow['memory_usage_mb'])
 
 
 if __name__ == '__main__':
@@ -1,12 +1,17 @@
 """Unit tests for the main pipeline."""
 
+import importlib.util
 import unittest
+import numpy as np
 import pandas as pd
 import tempfile
 import shutil
 from pathlib import Path
 
 from src.pipeline import DataCleaningPipeline
+from src.ingestion import ingest_file
+from src.validation import generate_data_quality_report
+from src.streaming import ingest_chunks, clean_chunk, HashSet, SeenRows, RunningQualityReport, _column_hashes, _combine_hashes
 from src.exceptions import PipelineError
 
 
@@ -105,6 +110,182 @@ class TestDataCleaningPipeline(unittest.TestCase):
         self.assertIn('total_rows', report)
         self.assertIn('total_columns', report)
         self.assertIn('column_stats', report)
+    
+    @unittest.skipUnless(importlib.util.find_spec("dask"), "dask not installed")
+    def test_pipeline_run_dask_backend(self):
+        """Test pipeline execution on the Dask backend."""
+        pipeline = DataCleaningPipeline(
+            input_path=self.input_path,
+            output_dir=self.output_dir,
+            output_filename="cleaned.csv",
+            backend="dask"
+        )
+        
+        pipeline.run()
+        report = pipeline.get_quality_report()
+        
+        self.assertEqual(report['total_rows'], 4)
+        self.assertEqual(report['total_missing_values'], 0)
+        self.assertTrue(list(self.output_dir.glob("cleaned-*.csv")))
+        self.assertTrue((self.output_dir / "quality_report.json").exists())
+    
+    @unittest.skipUnless(importlib.util.find_spec("pyarrow"), "pyarrow not installed")
+    def test_pipeline_run_arrow_backend(self):
+        """Test pipeline execution on the Arrow backend."""
+        pipeline = DataCleaningPipeline(
+            input_path=self.input_path,
+            output_dir=self.output_dir,
+            output_filename="cleaned.csv",
+            backend="arrow"
+        )
+        
+        table = pipeline.run(export_format="parquet")
+        report = pipeline.get_quality_report()
+        
+        self.assertEqual(table.num_rows, 4)
+        self.assertEqual(table.column("name").to_pylist(), ['Alice', 'Bob', 'Charlie', 'Alice'])
+        self.assertEqual(report['total_missing_values'], 0)
+        self.assertTrue((self.output_dir / "cleaned.parquet").exists())
+    
+    def _run_categorical_parquet(self, backend):
+        """Run a Parquet input with a messy categorical column; return the cleaned frame and report."""
+        parquet_path = Path(self.temp_dir) / "input.parquet"
+        self.test_data.assign(
+            Status=pd.Categorical(['  active  ', 'active', 'active', None, 'inactive'])
+        ).to_parquet(parquet_path, index=False)
+        
+        pipeline = DataCleaningPipeline(
+            input_path=parquet_path,
+            output_dir=self.output_dir / backend,
+            backend=backend
+        )
+        cleaned = pipeline.run()
+        if backend == "arrow":
+            cleaned = cleaned.to_pandas()
+        elif backend == "dask":
+            cleaned = cleaned.compute()
+        return cleaned, pipeline.get_quality_report()
+    
+    @unittest.skipUnless(importlib.util.find_spec("pyarrow"), "pyarrow not installed")
+    def test_pipeline_run_arrow_backend_categorical_parquet(self):
+        """Test that categorical Parquet columns are cleaned like on the pandas backend."""
+        expected, expected_report = self._run_categorical_parquet("pandas")
+        result, report = self._run_categorical_parquet("arrow")
+        
+        self.assertIsInstance(result['status'].dtype, pd.CategoricalDtype)
+        self.assertEqual(result['status'].tolist(), expected['status'].tolist())
+        self.assertEqual(report['duplicate_rows'], expected_report['duplicate_rows'])
+        self.assertEqual(report['column_stats']['status']['unique_values'], 2)
+    
+    @unittest.skipUnless(importlib.util.find_spec("dask"), "dask not installed")
+    def test_pipeline_run_dask_backend_categorical_parquet(self):
+        """Test that the Dask backend strips categorical text like the pandas backend."""
+        expected, expected_report = self._run_categorical_parquet("pandas")
+        result, report = self._run_categorical_parquet("dask")
+        
+        self.assertEqual(sorted(result['status'].tolist()), sorted(expected['status'].tolist()))
+        self.assertEqual(report['duplicate_rows'], expected_report['duplicate_rows'])
+    
+    def test_pipeline_run_chunked_backend(self):
+        """Test streaming pipeline execution on the chunked backend."""
+        pipeline = DataCleaningPipeline(
+            input_path=self.input_path,
+            output_dir=self.output_dir,
+            output_filename="cleaned.csv",
+            backend="chunked"
+        )
+        
+        pipeline.run()
+        report = pipeline.get_quality_report()
+        output = pd.read_csv(self.output_dir / "cleaned.csv")
+        
+        self.assertEqual(report['total_rows'], 4)
+        self.assertEqual(report['duplicate_rows'], 0)
+        self.assertEqual(report['total_missing_values'], 0)
+        self.assertEqual(report['column_stats']['age']['max'], 40.0)
+        self.assertEqual(len(output), 4)
+    
+    def test_clean_chunks_removes_duplicates_across_chunks(self):
+        """Test that duplicates split over chunk boundaries are removed."""
+        seen_rows = SeenRows()
+        chunks = [
+            clean_chunk(chunk, seen_rows, missing_value_strategy='drop_rows')
+            for chunk in ingest_chunks(self.input_path, chunksize=2)
+        ]
+        
+        # Rows 2 and 3 are duplicates and land in different chunks
+        self.assertEqual(sum(len(chunk) for chunk in chunks), 3)
+    
+    def test_combine_hashes_matches_pandas(self):
+        """Test that row hashes combined from column hashes match hash_pandas_object."""
+        df = self.test_data.assign(
+            score=[1.5, None, None, 4.0, 5.5],
+            group=pd.Categorical(['a', 'b', 'b', None, 'a'])
+        )
+        
+        expected = pd.util.hash_pandas_object(df, index=False).to_numpy()
+        np.testing.assert_array_equal(_combine_hashes(_column_hashes(df), len(df)), expected)
+    
+    def test_hash_set_matches_python_set(self):
+        """Test the NumPy hash set against a Python set while it grows."""
+        rng = np.random.default_rng(0)
+        hashes = HashSet(capacity=8)
+        expected = set()
+        for _ in range(5):
+            keys = np.unique(rng.integers(0, 5000, 2000).astype(np.uint64))
+            present = hashes.add(keys)
+            np.testing.assert_array_equal(present, [key in expected for key in keys.tolist()])
+            expected.update(keys.tolist())
+        
+        self.assertEqual(len(hashes), len(expected))
+    
+    def test_running_quality_report_matches_full_report(self):
+        """Test that the report accumulated over chunks matches the report on the whole frame."""
+        df = self.test_data
+        report = RunningQualityReport()
+        for start in range(0, len(df), 2):
+            report.update(df.iloc[start:start + 2])
+        
+        result = report.to_dict()
+        expected = generate_data_quality_report(df)
+        self.assertEqual(result['duplicate_rows'], expected['duplicate_rows'])
+        for col, stats in expected['column_stats'].items():
+            self.assertEqual(result['column_stats'][col]['unique_values'], stats['unique_values'])
+    
+    def test_pipeline_raw_data_isolated(self):
+        """Test that cleaning leaves the ingested raw data untouched."""
+        pipeline = DataCleaningPipeline(
+            input_path=self.input_path,
+            output_dir=self.output_dir,
+            output_filename="cleaned.csv"
+        )
+        
+        pipeline.run()
+        
+        self.assertIsNot(pipeline.raw_data, pipeline.cleaned_data)
+        pd.testing.assert_frame_equal(pipeline.raw_data, ingest_file(self.input_path))
+    
+    def test_pipeline_validation_rules(self):
+        """Test that failing validation rules stop the pipeline."""
+        pipeline = DataCleaningPipeline(
+            input_path=self.input_path,
+            output_dir=self.output_dir,
+            output_filename="cleaned.csv"
+        )
+        
+        pipeline.run(validation_rules={'schema': ['id', 'name'], 'ranges': {'age': {'max': 65}}})
+        
+        with self.assertRaises(PipelineError):
+            pipeline.run(validation_rules={'ranges': {'age': {'max': 30}}})
+    
+    def test_pipeline_unknown_backend(self):
+        """Test pipeline initialization with an unknown backend."""
+        with self.assertRaises(ValueError):
+            DataCleaningPipeline(
+                input_path=self.input_path,
+                output_dir=self.output_dir,
+                backend="spark"
+            )
 
 
 if __name__ == '__main__':
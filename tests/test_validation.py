@@ -1,14 +1,19 @@
 """Unit tests for data validation module."""
 
+import importlib.util
 import unittest
+from unittest import mock
 import pandas as pd
 import numpy as np
 
+from src import validation
 from src.validation import (
     validate_schema,
     validate_data_types,
     validate_ranges,
     validate_completeness,
+    run_validations,
+    validate_all,
     generate_data_quality_report
 )
 from src.exceptions import DataValidationError
@@ -17,87 +22,240 @@ from src.exceptions import DataValidationError
 class TestDataValidation(unittest.TestCase):
     """Test cases for data validation functions."""
     
-    def test_validate_schema_success(self):
-        """Test successful schema validation."""
-        df = pd.DataFrame({
+    @classmethod
+    def setUpClass(cls):
+        """Build the frames shared by several tests once; validators never modify them."""
+        cls.people = pd.DataFrame({
             'id': [1, 2, 3],
-            'name': ['a', 'b', 'c']
+            'name': ['a', 'b', 'c'],
+            'age': [25, 30, 150]  # 150 exceeds the usual max
         })
-        
-        result = validate_schema(df, ['id', 'name'])
+        cls.ages = pd.DataFrame({
+            'age': [25, 30, 35, 40]
+        })
+        cls.partially_complete = pd.DataFrame({
+            'id': [1, 2, 3, 4, 5],
+            'name': ['a', 'b', 'c', 'd', 'e'],
+            'nickname': ['a', np.nan, np.nan, np.nan, 'e']  # Only 40% complete
+        })
+    
+    def test_validate_schema_success(self):
+        """Test successful schema validation."""
+        result = validate_schema(self.people, ['id', 'name'])
         self.assertTrue(result)
     
     def test_validate_schema_missing_column(self):
         """Test schema validation with missing column."""
-        df = pd.DataFrame({
-            'id': [1, 2, 3]
-        })
-        
         with self.assertRaises(DataValidationError):
-            validate_schema(df, ['id', 'name'])
+            validate_schema(self.people[['id']], ['id', 'name'])
+    
+    def test_validate_schema_strict(self):
+        """Test strict schema validation reports missing and extra columns in order."""
+        df = pd.DataFrame({'id': [1], 'extra': [2], 'name': ['a']})
+        
+        self.assertTrue(validate_schema(df, ['name', 'extra', 'id'], strict=True))
+        
+        with self.assertRaisesRegex(DataValidationError, r"Missing: \['age', 'city'\], Extra: \['extra'\]"):
+            validate_schema(df, ['id', 'age', 'name', 'city'], strict=True)
     
     def test_validate_data_types(self):
         """Test data type validation."""
-        df = pd.DataFrame({
-            'id': [1, 2, 3],
-            'name': ['a', 'b', 'c'],
-            'age': [25, 30, 35]
-        })
-        
         type_requirements = {
             'id': 'numeric',
             'name': 'string',
             'age': 'numeric'
         }
         
-        result = validate_data_types(df, type_requirements)
+        result = validate_data_types(self.people, type_requirements)
         self.assertTrue(result)
     
-    def test_validate_ranges_success(self):
-        """Test successful range validation."""
+    def test_validate_data_types_specific(self):
+        """Test validation against specific dtype names."""
         df = pd.DataFrame({
-            'age': [25, 30, 35, 40]
+            'id': np.array([1, 2, 3], dtype='int32'),
+            'group': pd.Categorical(['a', 'b', 'a'])
         })
         
+        self.assertTrue(validate_data_types(df, {'id': 'int32', 'group': 'category'}))
+        self.assertTrue(validate_data_types(df, {'id': 'int'}))
+        
+        with self.assertRaises(DataValidationError):
+            validate_data_types(df, {'id': 'float64'})
+    
+    def test_validate_data_types_unknown_name(self):
+        """Test that a name that is not a dtype fails on a float column."""
+        df = pd.DataFrame({'x': [1.0, 2.0]})
+        
+        with self.assertRaisesRegex(DataValidationError, "'x' should be foobar"):
+            validate_data_types(df, {'x': 'foobar'})
+    
+    def test_validate_data_types_families(self):
+        """Test the type-family names against datetime and string dtypes."""
+        df = pd.DataFrame({
+            'when': pd.to_datetime(['2024-01-01', '2024-01-02']),
+            'name': pd.array(['a', 'b'], dtype='string')
+        })
+        
+        self.assertTrue(validate_data_types(df, {'when': 'datetime', 'name': 'string'}))
+        
+        with self.assertRaisesRegex(DataValidationError, "'when' should be numeric"):
+            validate_data_types(df, {'when': 'numeric'})
+    
+    def test_validate_ranges_success(self):
+        """Test successful range validation."""
         range_requirements = {
             'age': {'min': 18, 'max': 65}
         }
         
-        result = validate_ranges(df, range_requirements)
+        result = validate_ranges(self.ages, range_requirements)
         self.assertTrue(result)
     
     def test_validate_ranges_violation(self):
         """Test range validation with violations."""
-        df = pd.DataFrame({
-            'age': [25, 30, 150]  # 150 exceeds max
-        })
-        
         range_requirements = {
             'age': {'min': 18, 'max': 120}
         }
         
         with self.assertRaises(DataValidationError):
-            validate_ranges(df, range_requirements)
+            validate_ranges(self.people, range_requirements)
     
-    def test_validate_completeness_success(self):
-        """Test successful completeness validation."""
+    def test_validation_error_fields(self):
+        """Test that a failed check exposes its name and individual errors."""
+        df = pd.DataFrame({'age': [-1, 150]})
+        
+        with self.assertRaises(DataValidationError) as ctx:
+            validate_ranges(df, {'age': {'min': 0, 'max': 120}, 'height': {'min': 0}})
+        
+        self.assertEqual(ctx.exception.check, "Range")
+        self.assertEqual(len(ctx.exception.errors), 3)
+        self.assertTrue(str(ctx.exception).startswith("Range validation failed: Column 'height' not found; "))
+        self.assertEqual(ctx.exception.args, (str(ctx.exception),))
+    
+    def test_validate_ranges_ignores_missing_values(self):
+        """Test range validation with NaN values and a one-sided range."""
         df = pd.DataFrame({
-            'id': [1, 2, 3, 4, 5],
-            'name': ['a', 'b', 'c', 'd', 'e']
+            'age': [25, np.nan, 35, -1]
         })
         
-        result = validate_completeness(df, ['id', 'name'], completeness_threshold=0.8)
+        with self.assertRaisesRegex(DataValidationError, "1 values below minimum 0"):
+            validate_ranges(df, {'age': {'min': 0}})
+        
+        # The same check through the loop that Numba compiles when installed
+        kernel = validation._count_out_of_range_loop
+        with mock.patch("src.validation._count_out_of_range", kernel):
+            with self.assertRaisesRegex(DataValidationError, "1 values below minimum 0"):
+                validate_ranges(df, {'age': {'min': 0}})
+    
+    def test_validate_ranges_numpy_fallback(self):
+        """Test range validation without Numba or Polars, on plain and nullable columns."""
+        df = pd.DataFrame({
+            'age': [25, 30, 150],
+            'score': pd.array([1, None, 7], dtype='Int64')
+        })
+        
+        with mock.patch("src.validation._count_out_of_range", None), mock.patch("src.validation.pl", None):
+            self.assertTrue(validate_ranges(df, {'score': {'min': 0, 'max': 10}}))
+            with self.assertRaisesRegex(DataValidationError, "1 values above maximum 120"):
+                validate_ranges(df, {'age': {'max': 120}, 'score': {'min': 0}})
+    
+    def test_validate_ranges_engines(self):
+        """Test that every available range engine finds the same violations."""
+        engines = ["numpy"]
+        if importlib.util.find_spec("polars"):
+            engines.append("polars")
+        if validation._count_out_of_range is not None:
+            engines.append("numba")
+        
+        for engine in engines:
+            with self.subTest(engine=engine):
+                with self.assertRaisesRegex(DataValidationError, "1 values above maximum 120"):
+                    validate_ranges(self.people, {'age': {'max': 120}, 'id': {'min': 1}}, engine=engine)
+        
+        with self.assertRaises(ValueError):
+            validate_ranges(self.people, {'age': {'max': 120}}, engine='numexpr')
+        with mock.patch("src.validation._count_out_of_range", None):
+            with self.assertRaises(ImportError):
+                validate_ranges(self.people, {'age': {'max': 120}}, engine='numba')
+    
+    def test_validate_ranges_large_integers(self):
+        """Test that int64 values beyond float precision are compared exactly."""
+        df = pd.DataFrame({'a': [2**53 + 1]})
+        engines = ["numpy"]
+        if importlib.util.find_spec("polars"):
+            engines.append("polars")
+        
+        for engine in engines:
+            with self.subTest(engine=engine):
+                with self.assertRaisesRegex(DataValidationError, "1 values above maximum"):
+                    validate_ranges(df, {'a': {'max': 2**53}}, engine=engine)
+    
+    def test_validate_ranges_downcast(self):
+        """Test range validation on downcast integer columns."""
+        df = pd.DataFrame({
+            'age': np.array([25, 30, 35, 300], dtype='int64'),
+            'score': [0.5, 1.0, 1.5, 2.0]
+        })
+        
+        self.assertTrue(validate_ranges(df, {'age': {'min': 18}, 'score': {'max': 2.0}}, downcast=True))
+        
+        with self.assertRaisesRegex(DataValidationError, "1 values above maximum 120"):
+            validate_ranges(df, {'age': {'max': 120}}, downcast=True)
+        self.assertEqual(df['age'].dtype, np.int64)
+    
+    def test_validate_completeness_success(self):
+        """Test successful completeness validation."""
+        result = validate_completeness(self.partially_complete, ['id', 'name'], completeness_threshold=0.8)
         self.assertTrue(result)
     
     def test_validate_completeness_failure(self):
         """Test completeness validation failure."""
+        with self.assertRaises(DataValidationError):
+            validate_completeness(self.partially_complete, ['nickname'], completeness_threshold=0.8)
+    
+    @unittest.skipUnless(importlib.util.find_spec("pyarrow"), "pyarrow not installed")
+    def test_validate_completeness_arrow_strings(self):
+        """Test completeness on the Arrow-backed strings the pipeline produces."""
         df = pd.DataFrame({
-            'id': [1, 2, 3, 4, 5],
-            'name': ['a', np.nan, np.nan, np.nan, 'e']  # Only 40% complete
+            'name': pd.array(['a', None, None, None, 'e'], dtype='string[pyarrow]'),
+            'city': pd.array(['x', 'y', 'z', 'x', 'y'], dtype='string[pyarrow]')
         })
         
-        with self.assertRaises(DataValidationError):
-            validate_completeness(df, ['name'], completeness_threshold=0.8)
+        self.assertTrue(validate_completeness(df, ['city'], completeness_threshold=1.0))
+        with self.assertRaisesRegex(DataValidationError, "'name' completeness 40.00%"):
+            validate_completeness(df, ['name', 'city'], completeness_threshold=0.8)
+    
+    def test_run_validations(self):
+        """Test running several validations together."""
+        df = self.people
+        
+        self.assertTrue(run_validations(df, schema=['id', 'age'], types={'age': 'numeric'}))
+        
+        with self.assertRaisesRegex(DataValidationError, "Range validation failed"):
+            run_validations(df, schema=['id', 'age'], ranges={'age': {'max': 120}}, completeness=['id'])
+    
+    def test_validate_all_reports_every_failure(self):
+        """Test the combined check lists failures from each validation, with or without Polars."""
+        df = self.partially_complete.assign(age=[25, 30, np.nan, 150, -1])
+        spec = {
+            'schema': ['id', 'city'],
+            'types': {'name': 'numeric'},
+            'ranges': {'age': {'min': 0, 'max': 120}},
+            'completeness': ['nickname', 'id', 'age'],
+            'completeness_threshold': 0.8
+        }
+        
+        self.assertTrue(validate_all(df, ranges={'age': {'min': -1}}, completeness=['id', 'name']))
+        for polars in (validation.pl, None):
+            with self.subTest(polars=polars is not None), mock.patch("src.validation.pl", polars):
+                with self.assertRaises(DataValidationError) as ctx:
+                    validate_all(df, **spec)
+                self.assertEqual(ctx.exception.errors, [
+                    "Missing required columns: ['city']",
+                    "Column 'name' should be numeric, got object",
+                    "Column 'age' has 1 values below minimum 0",
+                    "Column 'age' has 1 values above maximum 120",
+                    "Column 'nickname' completeness 40.00% below threshold 80.00%"
+                ])
     
     def test_generate_data_quality_report(self):
         """Test quality report generation."""
@@ -114,6 +272,81 @@ class TestDataValidation(unittest.TestCase):
         self.assertIn('duplicate_rows', report)
         self.assertEqual(report['total_missing_values'], 1)
         self.assertIn('column_stats', report)
+    
+    def test_quality_report_without_duplicate_count(self):
+        """Test that skipping the duplicate count still reports whether duplicates exist."""
+        df = pd.DataFrame({'id': [1, 2, 2], 'value': [10, 20, 20]})
+        
+        report = generate_data_quality_report(df, include_duplicate_count=False)
+        with mock.patch("src.validation.pl", None):
+            expected = generate_data_quality_report(df, include_duplicate_count=False)
+            unique = generate_data_quality_report(df.drop_duplicates(), include_duplicate_count=False)
+        
+        for result in (report, expected):
+            self.assertIsNone(result['duplicate_rows'])
+            self.assertTrue(result['has_duplicates'])
+        self.assertFalse(unique['has_duplicates'])
+        self.assertEqual(generate_data_quality_report(df)['duplicate_rows'], 1)
+    
+    def test_quality_report_categorical_unique_values(self):
+        """Test that categorical columns count only the categories in use."""
+        df = pd.DataFrame({
+            'status': pd.Categorical(['a', None, 'b', 'a'], categories=['a', 'b', 'unused'])
+        })
+        
+        with mock.patch("src.validation.pl", None):
+            report = generate_data_quality_report(df)
+        
+        self.assertEqual(report['column_stats']['status']['unique_values'], 2)
+    
+    def test_quality_report_duplicates_match_duplicated(self):
+        """Test that mixed-type object columns count duplicates like df.duplicated()."""
+        df = pd.DataFrame({'m': [1, '1', 1.0, True]})
+        
+        report = generate_data_quality_report(df)
+        with mock.patch("src.validation.pl", None):
+            expected = generate_data_quality_report(df)
+        
+        for result in (report, expected):
+            self.assertEqual(result['duplicate_rows'], df.duplicated().sum())
+        self.assertFalse(generate_data_quality_report(df.drop_duplicates())['has_duplicates'])
+    
+    @unittest.skipUnless(importlib.util.find_spec("polars"), "polars not installed")
+    def test_quality_report_polars_matches_pandas(self):
+        """Test that the fused Polars report matches the pandas one."""
+        df = pd.DataFrame({
+            'id': [1, 2, 2, 3],
+            'value': [10, np.nan, np.nan, 40],
+            'name': ['a', None, None, 'c']
+        })
+        
+        report = generate_data_quality_report(df)
+        with mock.patch("src.validation.pl", None):
+            expected = generate_data_quality_report(df)
+        
+        self.assertEqual(report['duplicate_rows'], expected['duplicate_rows'])
+        self.assertEqual(report['total_missing_values'], expected['total_missing_values'])
+        for col, stats in expected['column_stats'].items():
+            for key, value in stats.items():
+                self.assertAlmostEqual(report['column_stats'][col][key], value)
+    
+    @unittest.skipUnless(importlib.util.find_spec("pyarrow"), "pyarrow not installed")
+    def test_quality_report_arrow_table(self):
+        """Test that an Arrow Table is reported on like the equivalent dataframe."""
+        import pyarrow as pa
+        
+        df = pd.DataFrame({
+            'id': [1, 2, 2, 3],
+            'value': [10, np.nan, np.nan, 40]
+        })
+        
+        report = generate_data_quality_report(pa.Table.from_pandas(df, preserve_index=False))
+        expected = generate_data_quality_report(df)
+        
+        self.assertEqual(report['duplicate_rows'], expected['duplicate_rows'])
+        self.assertEqual(report['total_missing_values'], expected['total_missing_values'])
+        self.assertAlmostEqual(report['column_stats']['value']['median'], expected['column_stats']['value']['median'])
+        self.assertEqual(report['column_stats']['id']['unique_values'], 3)
 
 
 if __name__ == '__main__':